@@ -2,6 +2,8 @@
 
 Many Bluetooth speakers enter standby after 30-120 seconds of silence.
 This service streams inaudible audio to keep the connection alive.
+A single pacat process is kept open per service and fed a short burst
+every STREAM_INTERVAL seconds.
 
 Two methods:
 - "silence": PCM zeros. Minimal CPU. Some speakers detect digital silence
@@ -11,10 +13,17 @@ Two methods:
   Approach from adrgumula/HomeAssistantBluetoothSpeaker.
 """
 
+import array
 import asyncio
+import fcntl
+import functools
 import logging
 import math
-import struct
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .pulse import PulseAudioManager
 
 logger = logging.getLogger(__name__)
 
@@ -22,15 +31,81 @@ SAMPLE_RATE = 44100
 CHANNELS = 1
 STREAM_DURATION = 1.0  # seconds per burst
 STREAM_INTERVAL = 5.0  # seconds between bursts
+CLIENT_NAME = "bt-audio-keepalive"  # pacat application.name
+
+
+@functools.lru_cache(maxsize=8)
+def _generate_audio(
+    method: str,
+    rate: int = SAMPLE_RATE,
+    duration: float = STREAM_DURATION,
+) -> bytes:
+    """Return the keep-alive audio buffer for *method*.
+
+    Cached at module level so every KeepAliveService (one per device)
+    and every restart shares the same immutable buffer.
+    """
+    if method == "silence":
+        return _generate_silence(rate, duration)
+    return _generate_infrasound(rate, duration)
+
+
+def _generate_silence(rate: int, duration: float) -> bytes:
+    """Generate PCM silence (all zeros)."""
+    num_samples = int(rate * duration)
+    return bytes(num_samples * 2)
+
+
+def _generate_infrasound(
+    rate: int, duration: float, freq: float = 2.0, amplitude: int = 100,
+) -> bytes:
+    """Generate a 2 Hz sine wave at very low amplitude.
+
+    At 2 Hz, the signal is well below the human hearing threshold (~20 Hz).
+    Amplitude of 100 out of 32767 is -50 dB, effectively inaudible even
+    if a speaker could reproduce it.
+    """
+    num_samples = int(rate * duration)
+    step = 2.0 * math.pi * freq / rate
+    # Two-pole oscillator: sin((n+1)w) = 2cos(w)*sin(nw) - sin((n-1)w),
+    # so each sample costs one multiply and one subtract, no sin() call.
+    coeff = 2.0 * math.cos(step)
+    samples = array.array("h", bytes(num_samples * 2))
+    y1, y2 = amplitude * math.sin(step), 0.0  # y[1], y[0]
+    for i in range(1, num_samples):
+        samples[i] = int(y1)
+        y1, y2 = coeff * y1 - y2, y1
+    if sys.byteorder != "little":
+        samples.byteswap()  # array uses native order; pacat expects s16le
+    return samples.tobytes()
+
+
+def _grow_pipe(proc: asyncio.subprocess.Process, size: int) -> None:
+    """Enlarge pacat's stdin pipe so a whole burst fits in one write().
+
+    The default 64 KiB pipe is smaller than a one-second 44.1 kHz burst,
+    which makes asyncio split every burst into a partial write plus a
+    buffered copy of the remainder. Linux-only; failure is harmless.
+    """
+    setpipe = getattr(fcntl, "F_SETPIPE_SZ", None)
+    if setpipe is None or proc.stdin is None:
+        return
+    try:
+        pipe = proc.stdin.transport.get_extra_info("pipe")
+        fcntl.fcntl(pipe.fileno(), setpipe, size)
+    except (AttributeError, OSError) as e:
+        logger.debug("Could not resize keep-alive pipe: %s", e)
 
 
 class KeepAliveService:
     """Streams inaudible audio to a Bluetooth sink to prevent auto-shutdown."""
 
-    def __init__(self, method: str = "infrasound"):
+    def __init__(self, method: str = "infrasound", pulse: "PulseAudioManager | None" = None):
         self._method = method
+        self._pulse = pulse
         self._target_sink: str | None = None
         self._task: asyncio.Task | None = None
+        self._proc: asyncio.subprocess.Process | None = None
         self._running = False
 
     def set_target_sink(self, sink_name: str) -> None:
@@ -56,56 +131,73 @@ class KeepAliveService:
             except asyncio.CancelledError:
                 pass
         self._task = None
+        await self._close_stream()
         logger.info("Keep-alive service stopped")
 
+    async def _open_stream(self, burst_size: int) -> asyncio.subprocess.Process:
+        """Spawn a long-lived pacat playback stream to the target sink."""
+        proc = await asyncio.create_subprocess_exec(
+            "pacat",
+            "--device", self._target_sink,
+            f"--client-name={CLIENT_NAME}",
+            "--format=s16le",
+            f"--rate={SAMPLE_RATE}",
+            f"--channels={CHANNELS}",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        _grow_pipe(proc, burst_size)
+        return proc
+
+    async def _close_stream(self) -> None:
+        """Close the pacat stream (EOF on stdin) and reap the process."""
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            if proc.stdin and not proc.stdin.is_closing():
+                proc.stdin.close()
+            await asyncio.wait_for(proc.wait(), timeout=2.0)
+        except (asyncio.TimeoutError, ProcessLookupError):
+            try:
+                proc.kill()
+            except ProcessLookupError:
+                pass
+        except Exception as e:
+            logger.debug("Keep-alive stream close error: %s", e)
+
+    async def _sink_busy(self) -> bool:
+        """Return True if another client is already playing to the target sink."""
+        if not self._pulse:
+            return False
+        try:
+            return await self._pulse.is_sink_busy(self._target_sink, ignore_client=CLIENT_NAME)
+        except Exception as e:
+            logger.debug("Keep-alive busy check failed: %s", e)
+            return False
+
     async def _stream_loop(self) -> None:
-        """Periodically stream a short burst of inaudible audio via pacat."""
-        pcm_data = self._generate_audio()
+        """Periodically write a short burst of inaudible audio to pacat.
+
+        One pacat process is kept open for the lifetime of the loop and
+        fed a burst every interval, rather than forking pacat per burst.
+        The process is respawned if it exits (e.g. sink went away).
+        Bursts are skipped while another client is already playing to
+        the sink, since real audio keeps the speaker awake by itself.
+        """
+        pcm_data = _generate_audio(self._method)
 
         while self._running:
-            if self._target_sink:
+            if self._target_sink and not await self._sink_busy():
                 try:
-                    proc = await asyncio.create_subprocess_exec(
-                        "pacat",
-                        "--device", self._target_sink,
-                        "--format=s16le",
-                        f"--rate={SAMPLE_RATE}",
-                        f"--channels={CHANNELS}",
-                        stdin=asyncio.subprocess.PIPE,
-                        stdout=asyncio.subprocess.DEVNULL,
-                        stderr=asyncio.subprocess.DEVNULL,
-                    )
-                    proc.stdin.write(pcm_data)
-                    proc.stdin.close()
-                    await proc.wait()
+                    if self._proc is None or self._proc.returncode is not None:
+                        await self._close_stream()
+                        self._proc = await self._open_stream(len(pcm_data))
+                    self._proc.stdin.write(pcm_data)
+                    await self._proc.stdin.drain()
                 except Exception as e:
                     logger.debug("Keep-alive stream error: %s", e)
+                    await self._close_stream()
 
             await asyncio.sleep(STREAM_INTERVAL)
-
-    def _generate_audio(self) -> bytes:
-        """Generate the keep-alive audio buffer."""
-        if self._method == "silence":
-            return self._generate_silence()
-        return self._generate_infrasound()
-
-    @staticmethod
-    def _generate_silence() -> bytes:
-        """Generate PCM silence (all zeros)."""
-        num_samples = int(SAMPLE_RATE * STREAM_DURATION)
-        return b"\x00\x00" * num_samples
-
-    @staticmethod
-    def _generate_infrasound(freq: float = 2.0, amplitude: int = 100) -> bytes:
-        """Generate a 2 Hz sine wave at very low amplitude.
-
-        At 2 Hz, the signal is well below the human hearing threshold (~20 Hz).
-        Amplitude of 100 out of 32767 is -50 dB, effectively inaudible even
-        if a speaker could reproduce it.
-        """
-        num_samples = int(SAMPLE_RATE * STREAM_DURATION)
-        data = bytearray(num_samples * 2)
-        for i in range(num_samples):
-            value = int(amplitude * math.sin(2.0 * math.pi * freq * i / SAMPLE_RATE))
-            struct.pack_into("<h", data, i * 2, value)
-        return bytes(data)
@@ -11,6 +11,7 @@ import logging
 import os
 from collections.abc import Awaitable, Callable
 
+from pulsectl import PulseIndexError
 from pulsectl_asyncio import PulseAsync
 
 logger = logging.getLogger(__name__)
@@ -22,6 +23,26 @@ _FALLBACK_SERVERS = [
     "unix:/run/audio/native",
 ]
 
+# Prefixes of sink names created by module-bluez5-device: every BT
+# sink matches _BLUEZ_PREFIX; per-device A2DP/HFP sinks are named
+# _BLUEZ_SINK_PREFIX + "XX_XX_XX_XX_XX_XX.<profile>".
+_BLUEZ_PREFIX = "bluez_"
+_BLUEZ_SINK_PREFIX = "bluez_sink."
+
+
+def _addr_key(address: str) -> str:
+    """Return the sink/card-name form of a MAC (``XX_XX_XX_XX_XX_XX``)."""
+    return address.replace(":", "_")
+
+
+# Sink 'change' events arriving within this window are coalesced into
+# a single sink_info() read (PA fires several per volume step).
+SINK_CHANGE_DEBOUNCE = 0.05
+
+# wait_for_bt_sink() re-lists sinks at least this often even while the
+# event subscription is live, in case a "new" event was missed.
+SINK_WAIT_FALLBACK_POLL = 5.0
+
 # Regex for parsing "pactl list sinks" sample spec line,
 # e.g. "s16le 2ch 48000Hz"
 _SPEC_SUFFIX_HZ = "Hz"
@@ -50,6 +71,48 @@ def _capture_stderr():
             logger.debug("libpulse stderr: %s", captured)
 
 
+def _parse_sample_spec(spec_str: str) -> dict:
+    """Parse a pactl sample spec string, e.g. ``"s16le 2ch 48000Hz"``."""
+    fmt = None
+    rate = None
+    channels = None
+    for part in spec_str.split():
+        if part.endswith(_SPEC_SUFFIX_HZ):
+            try:
+                rate = int(part[: -len(_SPEC_SUFFIX_HZ)])
+            except ValueError:
+                pass
+        elif part.endswith(_SPEC_SUFFIX_CH):
+            try:
+                channels = int(part[: -len(_SPEC_SUFFIX_CH)])
+            except ValueError:
+                pass
+        else:
+            fmt = part
+    return {"format": fmt, "rate": rate, "channels": channels}
+
+
+# pa_sink_state_t values -> state names
+_STATE_NAMES = {-1: "invalid", 0: "running", 1: "idle", 2: "suspended"}
+
+
+def _sink_state_name(state) -> str:
+    """Return the state name ("running", "idle", ...) of a pulsectl sink.
+
+    pulsectl wraps the state in an EnumValue that holds the name (in
+    ``_value``, or ``value`` on some releases) and renders as
+    ``<EnumValue sink/source-state=running>``; a bare pa_sink_state_t
+    int is mapped via _STATE_NAMES.
+    """
+    if isinstance(state, int):
+        return _STATE_NAMES.get(state, str(state))
+    for attr in ("_value", "value"):
+        name = getattr(state, attr, None)
+        if isinstance(name, str):
+            return name
+    return str(state).split("=")[-1].rstrip(">")
+
+
 class PulseAudioManager:
     """Manages PulseAudio sinks for Bluetooth audio devices."""
 
@@ -60,32 +123,73 @@ class PulseAudioManager:
         self._volume_callback = None
         self._state_callback = None
         self._idle_callback = None
+        self._sinks_changed_callback = None
+        self._sinks_changed_handle: asyncio.TimerHandle | None = None
+        self._events_live = False  # True while the sink subscription is connected
+        self._bt_sink_states: dict[str, str] = {}  # sink name → last state seen
+        self._pending_changes: dict[int, asyncio.TimerHandle] = {}  # debounced sink changes
+        self._change_tasks: set[asyncio.Task] = set()
+        # wait_for_bt_sink() future -> sink-name prefix it is waiting for;
+        # resolved by the event monitor when a matching sink is created
+        self._sink_waiters: dict[asyncio.Future, str] = {}
+        # "XX_XX_XX_XX_XX_XX" -> bluez sink name; None means stale. Only
+        # trusted while the event monitor is running to invalidate it.
+        self._sink_by_addr: dict[str, str] | None = None
+        self._sink_generation = 0  # bumped on every sink new/remove
+        # Sink name -> sample spec. A sink's spec is fixed for its lifetime
+        # (codec/profile changes recreate the sink), so entries are only
+        # dropped alongside the address index on sink new/remove.
+        self._sample_specs: dict[str, dict] = {}
+        # Serialises connect()/reconnect() so concurrent callers can't
+        # each open (and leak) their own control connection
+        self._connect_lock = asyncio.Lock()
 
     async def connect(self) -> None:
         """Connect to the PulseAudio server.
 
         Tries PULSE_SERVER env var first, then known HAOS socket paths.
+        A no-op if this manager is already connected.
         """
+        async with self._connect_lock:
+            if self._pulse is not None:
+                return
+            await self._connect()
+
+    async def _connect(self) -> None:
+        """Open the control connection (caller holds ``_connect_lock``)."""
         # If PULSE_SERVER is set, try it directly
-        if os.environ.get("PULSE_SERVER"):
-            self._pulse = PulseAsync("bt-audio-manager")
-            with _capture_stderr():
-                await self._pulse.connect()
-            self._server = os.environ["PULSE_SERVER"]
+        env_server = os.environ.get("PULSE_SERVER")
+        if env_server:
+            pulse = PulseAsync("bt-audio-manager", server=env_server)
+            try:
+                with _capture_stderr():
+                    await pulse.connect()
+            except Exception:
+                pulse.close()
+                raise
+            self._pulse = pulse
+            self._server = env_server
             logger.info(
                 "Connected to PulseAudio via PULSE_SERVER=%s",
                 self._server,
             )
             return
 
-        # PULSE_SERVER not set — probe known HAOS audio socket paths
+        # PULSE_SERVER not set — probe known HAOS audio socket paths.
+        # Skip sockets that don't exist rather than waiting on a libpulse
+        # connect failure, and pass the address to PulseAsync directly so
+        # probing doesn't touch the process environment.
         for server in _FALLBACK_SERVERS:
+            if server.startswith("unix:") and not os.path.exists(server[5:]):
+                logger.debug("PulseAudio socket missing: %s", server)
+                continue
             try:
-                os.environ["PULSE_SERVER"] = server
-                self._pulse = PulseAsync("bt-audio-manager")
+                self._pulse = PulseAsync("bt-audio-manager", server=server)
                 with _capture_stderr():
                     await self._pulse.connect()
                 self._server = server
+                # Child pactl/pacat processes inherit the address from here
+                os.environ["PULSE_SERVER"] = server
                 logger.info("Connected to PulseAudio via %s", server)
                 return
             except Exception:
@@ -94,8 +198,7 @@ class PulseAudioManager:
                     self._pulse.close()
                     self._pulse = None
 
-        # None worked — clean up and raise
-        os.environ.pop("PULSE_SERVER", None)
+        # None worked
         raise ConnectionError(
             "PulseAudio not reachable at any known address. "
             "Check that 'audio: true' is set in config.yaml and "
@@ -115,6 +218,11 @@ class PulseAudioManager:
         Closes the old connection and retries until PA is back.
         The event monitor is restarted automatically on success.
         """
+        async with self._connect_lock:
+            await self._reconnect(retries, delay)
+
+    async def _reconnect(self, retries: int, delay: float) -> None:
+        """Reopen the control connection (caller holds ``_connect_lock``)."""
         if self._pulse:
             try:
                 self._pulse.close()
@@ -124,7 +232,7 @@ class PulseAudioManager:
 
         for attempt in range(1, retries + 1):
             try:
-                self._pulse = PulseAsync("bt-audio-manager")
+                self._pulse = PulseAsync("bt-audio-manager", server=self._server)
                 await self._pulse.connect()
                 logger.info("Reconnected to PulseAudio (attempt %d)", attempt)
                 await self.start_event_monitor()
@@ -165,6 +273,34 @@ class PulseAudioManager:
         """
         self._idle_callback = callback
 
+    def on_sinks_changed(self, callback) -> None:
+        """Register a callback for any sink add/remove/change.
+
+        Debounced by SINK_CHANGE_DEBOUNCE; also fires whenever the event
+        subscription (re)connects, since events may have been missed.
+        Callback signature: ``callback()``
+        """
+        self._sinks_changed_callback = callback
+
+    @property
+    def events_live(self) -> bool:
+        """True while sink events are being received from PulseAudio."""
+        return self._events_live
+
+    def _schedule_sinks_changed(self) -> None:
+        """Arm the debounced on_sinks_changed callback (no-op if pending)."""
+        if self._sinks_changed_callback is None or self._sinks_changed_handle is not None:
+            return
+        self._sinks_changed_handle = asyncio.get_running_loop().call_later(
+            SINK_CHANGE_DEBOUNCE, self._fire_sinks_changed,
+        )
+
+    def _fire_sinks_changed(self) -> None:
+        """Timer callback: report a batch of sink events."""
+        self._sinks_changed_handle = None
+        if self._sinks_changed_callback:
+            self._sinks_changed_callback()
+
     async def start_event_monitor(self) -> None:
         """Subscribe to PulseAudio sink events via pulsectl_asyncio.
 
@@ -187,50 +323,40 @@ class PulseAudioManager:
             self._subscribe_task = None
 
     async def _event_monitor_loop(self) -> None:
-        """Subscribe to sink events and log Bluetooth volume changes.
+        """Subscribe to sink events and dispatch Bluetooth sink changes.
 
         Auto-restarts with exponential backoff if the PA connection drops
         (e.g. after a module-bluez5-discover reload).
         """
         retry_delay = 2
-        bt_sink_states: dict[str, str] = {}
         while True:
             try:
-                _pe = PulseAsync("bt-audio-events")
+                _pe = PulseAsync("bt-audio-events", server=self._server)
                 with _capture_stderr():
                     await _pe.connect()
                 try:
                     retry_delay = 2  # reset on successful connection
+                    self._invalidate_sink_index()  # events may have been missed
+                    self._events_live = True
+                    self._schedule_sinks_changed()
                     logger.info("PA event subscription started (sink events)")
-                    async for event in _pe.subscribe_events("sink", "server"):
-                        if event.t == "change" and self._pulse:
-                            try:
-                                sink = await self._pulse.sink_info(event.index)
-                                if "bluez" in sink.name.lower():
-                                    vol = round(sink.volume.value_flat * 100)
-                                    state_name = getattr(sink.state, "name", str(sink.state))
-                                    logger.info(
-                                        "PA sink volume change: %s vol=%d%% mute=%s state=%s",
-                                        sink.name, vol, sink.mute, state_name,
-                                    )
-                                    if self._volume_callback:
-                                        self._volume_callback(sink.name, vol, sink.mute)
-                                    # Detect state transitions
-                                    prev_state = bt_sink_states.get(sink.name)
-                                    bt_sink_states[sink.name] = state_name
-                                    if state_name == "running" and prev_state != "running":
-                                        logger.info("BT sink %s → running (was %s)", sink.name, prev_state)
-                                        if self._state_callback:
-                                            self._state_callback(sink.name)
-                                    elif state_name != "running" and prev_state == "running":
-                                        logger.info("BT sink %s → %s (was running)", sink.name, state_name)
-                                        if self._idle_callback:
-                                            self._idle_callback(sink.name)
-                            except Exception as e:
-                                logger.debug("PA event handler error: %s", e)
+                    async for event in _pe.subscribe_events("sink"):
+                        self._schedule_sinks_changed()
+                        if event.t == "change":
+                            self._schedule_sink_change(event.index)
                         elif event.t in ("new", "remove"):
                             logger.info("PA sink %s: index=%d", event.t, event.index)
+                            self._invalidate_sink_index()
+                            if event.t == "new" and self._sink_waiters:
+                                await self._notify_sink_waiters(event.index)
                 finally:
+                    self._events_live = False
+                    for handle in self._pending_changes.values():
+                        handle.cancel()
+                    self._pending_changes.clear()
+                    if self._sinks_changed_handle is not None:
+                        self._sinks_changed_handle.cancel()
+                        self._sinks_changed_handle = None
                     _pe.close()
             except asyncio.CancelledError:
                 return  # clean shutdown
@@ -244,90 +370,148 @@ class PulseAudioManager:
                     return
                 retry_delay = min(retry_delay * 2, 30)
 
-    async def _pactl_sample_specs(self) -> dict[str, dict]:
+    def _schedule_sink_change(self, index: int) -> None:
+        """Coalesce a burst of 'change' events for one sink into one read.
+
+        PA emits several change events per volume step or state flip;
+        only the last one within SINK_CHANGE_DEBOUNCE triggers sink_info.
+        """
+        handle = self._pending_changes.pop(index, None)
+        if handle:
+            handle.cancel()
+        self._pending_changes[index] = asyncio.get_running_loop().call_later(
+            SINK_CHANGE_DEBOUNCE, self._fire_sink_change, index,
+        )
+
+    def _fire_sink_change(self, index: int) -> None:
+        """Timer callback: run the debounced change handler for *index*."""
+        self._pending_changes.pop(index, None)
+        task = asyncio.create_task(self._handle_sink_change(index))
+        self._change_tasks.add(task)
+        task.add_done_callback(self._change_tasks.discard)
+
+    async def _handle_sink_change(self, index: int) -> None:
+        """Report volume and running/idle transitions for a changed BT sink."""
+        if not self._pulse:
+            return
+        try:
+            sink = await self._pulse.sink_info(index)
+            if not sink.name.startswith(_BLUEZ_PREFIX):
+                return
+            vol = round(sink.volume.value_flat * 100)
+            state_name = _sink_state_name(sink.state)
+            logger.info(
+                "PA sink volume change: %s vol=%d%% mute=%s state=%s",
+                sink.name, vol, sink.mute, state_name,
+            )
+            if self._volume_callback:
+                self._volume_callback(sink.name, vol, sink.mute)
+            # Detect state transitions
+            prev_state = self._bt_sink_states.get(sink.name)
+            self._bt_sink_states[sink.name] = state_name
+            if state_name == "running" and prev_state != "running":
+                logger.info("BT sink %s → running (was %s)", sink.name, prev_state)
+                if self._state_callback:
+                    self._state_callback(sink.name)
+            elif state_name != "running" and prev_state == "running":
+                logger.info("BT sink %s → %s (was running)", sink.name, state_name)
+                if self._idle_callback:
+                    self._idle_callback(sink.name)
+        except Exception as e:
+            logger.debug("PA event handler error: %s", e)
+
+    def _invalidate_sink_index(self) -> None:
+        """Mark the address -> sink index stale after a sink add/remove."""
+        self._sink_by_addr = None
+        self._sample_specs = {}
+        self._sink_generation += 1
+
+    async def _notify_sink_waiters(self, index: int) -> None:
+        """Resolve any wait_for_bt_sink() futures matching a newly created sink."""
+        if not self._pulse:
+            return
+        try:
+            sink = await self._pulse.sink_info(index)
+        except Exception as e:
+            logger.debug("PA sink_info(%d) failed: %s", index, e)
+            return
+        for fut, prefix in list(self._sink_waiters.items()):
+            if sink.name.startswith(prefix) and not fut.done():
+                fut.set_result(sink.name)
+
+    async def _pactl_sample_specs(self, wanted: set[str] | None = None) -> dict[str, dict]:
         """Parse sample specs from ``pactl list sinks``.
 
         pulsectl's ctypes wrapper returns garbage for the sample_spec
         struct on bluez sinks (struct alignment / wire-protocol mismatch),
         so we shell out to pactl which deserializes correctly.
 
+        Output is parsed line by line as pactl writes it. If *wanted* is
+        given, only those sinks are recorded and pactl is stopped as soon
+        as all of them have been seen.
+
         Returns a dict keyed by sink name, e.g.
         ``{"bluez_sink.XX.a2dp_sink": {"format": "s16le", "rate": 48000, "channels": 2}}``
         """
+        if wanted is not None and not wanted:
+            return {}
         try:
             proc = await asyncio.create_subprocess_exec(
                 "pactl", "list", "sinks",
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
             )
-            stdout, _ = await proc.communicate()
-            if proc.returncode != 0:
-                return {}
         except (FileNotFoundError, OSError) as exc:
             logger.debug("pactl not available: %s", exc)
             return {}
 
         specs: dict[str, dict] = {}
         current_name: str | None = None
-        for line in stdout.decode(errors="replace").splitlines():
-            stripped = line.strip()
-            if stripped.startswith("Name:"):
-                current_name = stripped.split(":", 1)[1].strip()
-            elif stripped.startswith("Sample Specification:") and current_name:
-                # e.g. "s16le 2ch 48000Hz"
-                spec_str = stripped.split(":", 1)[1].strip()
-                fmt = None
-                rate = None
-                channels = None
-                for part in spec_str.split():
-                    if part.endswith(_SPEC_SUFFIX_HZ):
-                        try:
-                            rate = int(part[: -len(_SPEC_SUFFIX_HZ)])
-                        except ValueError:
-                            pass
-                    elif part.endswith(_SPEC_SUFFIX_CH):
-                        try:
-                            channels = int(part[: -len(_SPEC_SUFFIX_CH)])
-                        except ValueError:
-                            pass
-                    else:
-                        fmt = part
-                specs[current_name] = {
-                    "format": fmt,
-                    "rate": rate,
-                    "channels": channels,
-                }
+        try:
+            async for raw in proc.stdout:
+                stripped = raw.decode(errors="replace").strip()
+                if stripped.startswith("Name:"):
+                    current_name = stripped.partition(":")[2].strip()
+                elif stripped.startswith("Sample Specification:") and current_name:
+                    if wanted is None or current_name in wanted:
+                        specs[current_name] = _parse_sample_spec(stripped.partition(":")[2])
+                        if wanted is not None and len(specs) >= len(wanted):
+                            break
+        finally:
+            if proc.returncode is None:
+                try:
+                    proc.kill()
+                except ProcessLookupError:
+                    pass
+            await proc.wait()
         return specs
 
     async def list_bt_sinks(self) -> list[dict]:
         """List all Bluetooth A2DP sinks currently available."""
-        sinks = await self._pulse.sink_list()
-        sample_specs = await self._pactl_sample_specs()
+        sinks = [s for s in await self._pulse.sink_list() if s.name.startswith(_BLUEZ_PREFIX)]
+        # pactl stays the source of sample specs (see _pactl_sample_specs).
+        # Specs are remembered until the event monitor sees a sink change,
+        # and only reused while its subscription is live.
+        sample_specs = self._sample_specs if self._events_live else {}
+        missing = {sink.name for sink in sinks if sink.name not in sample_specs}
+        if missing:
+            sample_specs.update(await self._pactl_sample_specs(missing))
         bt_sinks = []
         for sink in sinks:
-            if "bluez" in sink.name.lower():
-                # Extract human-readable state from pulsectl enum
-                state_name = getattr(sink.state, "name", None)
-                if state_name is None:
-                    # Fallback: parse "<EnumValue sink/source-state=idle>"
-                    raw = str(sink.state)
-                    state_name = raw.split("=")[-1].rstrip(">") if "=" in raw else raw
-
-                # Sample spec from pactl (reliable) instead of pulsectl ctypes
-                spec = sample_specs.get(sink.name, {})
-
-                bt_sinks.append(
-                    {
-                        "name": sink.name,
-                        "description": sink.description,
-                        "state": state_name,
-                        "volume": round(sink.volume.value_flat * 100),
-                        "mute": sink.mute,
-                        "sample_rate": spec.get("rate"),
-                        "channels": spec.get("channels"),
-                        "format": spec.get("format"),
-                    }
-                )
+            spec = sample_specs.get(sink.name, {})
+
+            bt_sinks.append(
+                {
+                    "name": sink.name,
+                    "description": sink.description,
+                    "state": _sink_state_name(sink.state),
+                    "volume": round(sink.volume.value_flat * 100),
+                    "mute": sink.mute,
+                    "sample_rate": spec.get("rate"),
+                    "channels": spec.get("channels"),
+                    "format": spec.get("format"),
+                }
+            )
         return bt_sinks
 
     async def wait_for_bt_sink(
@@ -341,25 +525,58 @@ class PulseAudioManager:
         Matches both A2DP (``bluez_sink.XX.a2dp_sink``) and HFP
         (``bluez_sink.XX.headset_head_unit``) sinks.
 
-        If *connected_check* is provided, it is awaited each iteration to
+        Sink creation is picked up from the PA event monitor (one
+        ``sink_info`` lookup per new sink) rather than by polling
+        ``sink_list()``. Sinks are polled every second while the event
+        subscription is down, and every SINK_WAIT_FALLBACK_POLL seconds
+        otherwise.
+
+        If *connected_check* is provided, it is awaited each second to
         bail out early when the device disconnects mid-wait.
         """
-        addr_underscored = address.replace(":", "_")
-        expected_pattern = f"bluez_sink.{addr_underscored}"
+        expected_prefix = _BLUEZ_SINK_PREFIX + _addr_key(address)
 
-        deadline = asyncio.get_event_loop().time() + timeout
-        while asyncio.get_event_loop().time() < deadline:
+        # Register before listing so a sink created in between is not
+        # missed, check once for a sink that already exists, then wait for
+        # the event monitor to report it instead of re-listing every second.
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        self._sink_waiters[fut] = expected_prefix
+
+        try:
             sinks = await self._pulse.sink_list()
             for sink in sinks:
-                if expected_pattern in sink.name:
+                if sink.name.startswith(expected_prefix):
                     logger.info("BT sink ready: %s", sink.name)
                     return sink.name
-            if connected_check and not await connected_check():
-                logger.warning(
-                    "Device %s disconnected while waiting for BT sink", address
-                )
-                return None
-            await asyncio.sleep(1.0)
+
+            polled_at = loop.time()
+            async with asyncio.timeout(timeout):
+                while True:
+                    # Re-read each pass: the subscription may drop or recover mid-wait
+                    tick = 1.0 if connected_check or not self._events_live else SINK_WAIT_FALLBACK_POLL
+                    await asyncio.wait((fut,), timeout=tick)
+                    if fut.done():
+                        sink_name = fut.result()
+                        logger.info("BT sink ready: %s", sink_name)
+                        return sink_name
+                    if not self._events_live or loop.time() - polled_at >= SINK_WAIT_FALLBACK_POLL:
+                        # Subscription down (or an event missed) — poll
+                        polled_at = loop.time()
+                        sinks = await self._pulse.sink_list()
+                        for sink in sinks:
+                            if sink.name.startswith(expected_prefix):
+                                logger.info("BT sink ready: %s", sink.name)
+                                return sink.name
+                    if connected_check and not await connected_check():
+                        logger.warning(
+                            "Device %s disconnected while waiting for BT sink", address
+                        )
+                        return None
+        except TimeoutError:
+            pass
+        finally:
+            self._sink_waiters.pop(fut, None)
 
         logger.warning(
             "BT sink for %s did not appear within %ss", address, timeout
@@ -383,7 +600,7 @@ class PulseAudioManager:
 
         Returns True if the profile was activated successfully.
         """
-        card_name = "bluez_card." + address.replace(":", "_")
+        card_name = "bluez_card." + _addr_key(address)
 
         if profile == "hfp":
             # PA native HFP backend (HAOS default) uses "handsfree_head_unit";
@@ -479,15 +696,72 @@ class PulseAudioManager:
             logger.warning("PA card profile operation failed: %s", exc)
             return False
 
+    async def reload_bluez_discover(self) -> bool:
+        """Unload and reload ``module-bluez5-discover``.
+
+        Runs over the existing control connection rather than spawning
+        ``pactl`` (each of which opens its own PA connection).
+
+        Returns True if the module was reloaded. False means it wasn't
+        loaded or PA refused the reload; the caller falls back to an
+        audio service restart.
+        """
+        if not self._pulse:
+            return False
+        try:
+            module_ids = [
+                m.index for m in await self._pulse.module_list()
+                if m.name == "module-bluez5-discover"
+            ]
+            if not module_ids:
+                logger.warning("module-bluez5-discover not loaded — falling back to audio service restart")
+                return False
+
+            # Normally one instance, but unload any duplicates together
+            await asyncio.gather(*map(self._pulse.module_unload, module_ids))
+            logger.info(
+                "Unloaded module-bluez5-discover (index %s)",
+                ", ".join(str(i) for i in module_ids),
+            )
+            await asyncio.sleep(2)
+
+            await self._pulse.module_load("module-bluez5-discover")
+            logger.info("Reloaded module-bluez5-discover — PA HFP/HSP handler restored")
+            await asyncio.sleep(2)
+            return True
+        except Exception as e:
+            logger.warning(
+                "PA module reload failed: %s — falling back to audio service restart", e,
+            )
+            return False
+
     async def get_sink_for_address(self, address: str) -> str | None:
-        """Get the current sink name for a Bluetooth address, if it exists."""
-        addr_underscored = address.replace(":", "_")
-        pattern = f"bluez_sink.{addr_underscored}"
-        sinks = await self._pulse.sink_list()
-        for sink in sinks:
-            if pattern in sink.name:
-                return sink.name
-        return None
+        """Get the current sink name for a Bluetooth address, if it exists.
+
+        Served from an address -> sink index while the event subscription
+        is live (not while it is reconnecting, when sink events are being
+        missed). Otherwise the usual ``bluez_sink.<addr>.a2dp_sink`` name
+        is looked up directly, and only if that misses (e.g. the card is
+        on an HFP profile) is the index rebuilt from one ``sink_list()``.
+        """
+        key = _addr_key(address)
+        sink_by_addr = self._sink_by_addr
+        if sink_by_addr is not None and self._events_live:
+            return sink_by_addr.get(key)
+        try:
+            sink = await self._pulse.get_sink_by_name(f"{_BLUEZ_SINK_PREFIX}{key}.a2dp_sink")
+            return sink.name
+        except PulseIndexError:
+            pass
+        generation = self._sink_generation
+        sink_by_addr = {}
+        for sink in await self._pulse.sink_list():
+            if sink.name.startswith(_BLUEZ_SINK_PREFIX):
+                sink_by_addr.setdefault(sink.name.split(".")[1], sink.name)
+        # Don't publish if a sink event raced with the listing
+        if generation == self._sink_generation:
+            self._sink_by_addr = sink_by_addr
+        return sink_by_addr.get(key)
 
     async def get_sink_volume(self, sink_name: str) -> tuple[int, str] | None:
         """Get (volume_pct, state_name) for a specific sink.
@@ -495,30 +769,49 @@ class PulseAudioManager:
         Returns None if the sink is not found.
         """
         try:
-            sinks = await self._pulse.sink_list()
-            for sink in sinks:
-                if sink.name == sink_name:
-                    vol = round(sink.volume.value_flat * 100)
-                    state_name = getattr(sink.state, "name", None)
-                    if state_name is None:
-                        raw = str(sink.state)
-                        state_name = raw.split("=")[-1].rstrip(">") if "=" in raw else raw
-                    return (vol, state_name)
+            sink = await self._pulse.get_sink_by_name(sink_name)
+            vol = round(sink.volume.value_flat * 100)
+            return (vol, _sink_state_name(sink.state))
+        except PulseIndexError:
+            pass
         except Exception as e:
             logger.debug("get_sink_volume(%s) failed: %s", sink_name, e)
         return None
 
+    async def is_sink_busy(self, sink_name: str, ignore_client: str | None = None) -> bool:
+        """Return True if another client is currently streaming to *sink_name*.
+
+        Sink inputs whose ``application.name`` equals *ignore_client* are
+        not counted, so a caller can exclude its own stream (which would
+        otherwise keep the sink in 'running' on its own).
+        """
+        if not self._pulse:
+            return False
+        try:
+            sink, inputs = await asyncio.gather(
+                self._pulse.get_sink_by_name(sink_name),
+                self._pulse.sink_input_list(),
+            )
+            for si in inputs:
+                if si.sink != sink.index:
+                    continue
+                if ignore_client and si.proplist.get("application.name") == ignore_client:
+                    continue
+                return True
+        except Exception as e:
+            logger.debug("is_sink_busy(%s) failed: %s", sink_name, e)
+        return False
+
     async def suspend_sink(self, sink_name: str) -> bool:
         """Suspend a sink to release the A2DP transport."""
         if not self._pulse:
             return False
         try:
-            sinks = await self._pulse.sink_list()
-            for sink in sinks:
-                if sink.name == sink_name:
-                    await self._pulse.sink_suspend(sink.index, suspend=True)
-                    logger.info("Suspended PA sink: %s", sink_name)
-                    return True
+            sink = await self._pulse.get_sink_by_name(sink_name)
+            await self._pulse.sink_suspend(sink.index, suspend=True)
+            logger.info("Suspended PA sink: %s", sink_name)
+            return True
+        except PulseIndexError:
             logger.warning("Sink not found for suspend: %s", sink_name)
         except Exception as e:
             logger.warning("Failed to suspend sink %s: %s", sink_name, e)
@@ -529,12 +822,11 @@ class PulseAudioManager:
         if not self._pulse:
             return False
         try:
-            sinks = await self._pulse.sink_list()
-            for sink in sinks:
-                if sink.name == sink_name:
-                    await self._pulse.sink_suspend(sink.index, suspend=False)
-                    logger.info("Resumed PA sink: %s", sink_name)
-                    return True
+            sink = await self._pulse.get_sink_by_name(sink_name)
+            await self._pulse.sink_suspend(sink.index, suspend=False)
+            logger.info("Resumed PA sink: %s", sink_name)
+            return True
+        except PulseIndexError:
             logger.warning("Sink not found for resume: %s", sink_name)
         except Exception as e:
             logger.warning("Failed to resume sink %s: %s", sink_name, e)
@@ -552,7 +844,7 @@ class PulseAudioManager:
         try:
             proc = await asyncio.create_subprocess_exec(
                 "pactl", "set-sink-volume", sink_name, vol_str,
-                stdout=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.DEVNULL,
                 stderr=asyncio.subprocess.PIPE,
             )
             _, stderr = await proc.communicate()
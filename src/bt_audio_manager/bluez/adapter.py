@@ -3,8 +3,10 @@
 import asyncio
 import logging
 import os
+import time
+import weakref
 
-from dbus_next import Variant
+from dbus_next import Message, MessageType, Variant
 from dbus_next.aio import MessageBus
 from dbus_next.errors import DBusError
 
@@ -18,6 +20,7 @@ from .constants import (
     DEFAULT_ADAPTER_PATH,
     DEVICE_INTERFACE,
     LE_AUDIO_UUIDS,
+    MEDIA_TRANSPORT_INTERFACE,
     OBJECT_MANAGER_INTERFACE,
     PROPERTIES_INTERFACE,
     SINK_UUIDS,
@@ -25,11 +28,15 @@ from .constants import (
     cod_major_label,
     is_cod_audio_sink,
 )
+from .device import forget_device_proxies, invalidate_device_caches
 
 logger = logging.getLogger(__name__)
 
 _AVRCP_ONLY = frozenset({AVRCP_TARGET_UUID, AVRCP_CONTROLLER_UUID})
 _SOURCE_UUIDS = frozenset({A2DP_SOURCE_UUID})
+_BEARER_PREFIX = "org.bluez.Bearer."
+_BEARER_PREFIX_LEN = len(_BEARER_PREFIX)
+_BEARER_INTERFACES = (f"{_BEARER_PREFIX}BREDR1", f"{_BEARER_PREFIX}LE1")
 
 
 def _classify_rejection(uuids: set[str]) -> str:
@@ -45,6 +52,139 @@ def _classify_rejection(uuids: set[str]) -> str:
     return "no audio sink profile"
 
 
+def _prop(props: dict, key: str, default=None):
+    """Return the unwrapped value of property *key*, or *default* if absent."""
+    var = props.get(key)
+    return var.value if var is not None else default
+
+
+def _device_path_of(obj_path: str) -> str | None:
+    """Return the owning device path of a BlueZ sub-object, if any.
+
+    e.g. ``/org/bluez/hci0/dev_XX/sep1/fd0`` → ``/org/bluez/hci0/dev_XX``
+    """
+    parts = obj_path.split("/")
+    if len(parts) > 5 and parts[4].startswith("dev_"):
+        return "/".join(parts[:5])
+    return None
+
+
+# Root ObjectManager proxy per bus. Its introspection data is static for
+# the lifetime of bluetoothd, so "/" is introspected once per bus.
+_obj_managers = weakref.WeakKeyDictionary()  # MessageBus -> ProxyInterface
+
+
+async def _get_object_manager(bus: MessageBus):
+    """Return the (cached) org.freedesktop.DBus.ObjectManager interface on "/"."""
+    obj_manager = _obj_managers.get(bus)
+    if obj_manager is None:
+        introspection = await bus.introspect(BLUEZ_SERVICE, "/")
+        obj_manager = bus.get_proxy_object(
+            BLUEZ_SERVICE, "/", introspection
+        ).get_interface(OBJECT_MANAGER_INTERFACE)
+        _obj_managers[bus] = obj_manager
+    return obj_manager
+
+
+# GetManagedObjects replies are reused for this long by the static
+# helpers (list_all, remove_device_any_adapter), which UI polls and
+# reconcile passes tend to call in bursts.
+MANAGED_OBJECTS_MAX_AGE = 0.25
+
+# MessageBus -> (monotonic, objects, {"dev_XX_XX_...": [(adapter_path, device_path)]})
+_managed_objects = weakref.WeakKeyDictionary()
+_managed_objects_inflight = weakref.WeakKeyDictionary()  # MessageBus -> Task
+
+
+async def _fetch_managed_objects(bus: MessageBus) -> tuple:
+    """Fetch GetManagedObjects, index its device paths, and cache both."""
+    try:
+        obj_manager = await _get_object_manager(bus)
+        objects = await obj_manager.call_get_managed_objects()
+        # Built once per reply so address lookups don't scan every path
+        device_paths: dict[str, list[tuple[str, str]]] = {}
+        for path, ifaces in objects.items():
+            if DEVICE_INTERFACE in ifaces:
+                cut = path.rfind("/")
+                device_paths.setdefault(path[cut + 1:], []).append((path[:cut], path))
+        entry = (time.monotonic(), objects, device_paths)
+        _managed_objects[bus] = entry
+        return entry
+    finally:
+        _managed_objects_inflight.pop(bus, None)
+
+
+async def _get_managed_entry(bus: MessageBus, max_age: float = MANAGED_OBJECTS_MAX_AGE) -> tuple:
+    """Return a recent (timestamp, objects, device_paths) entry for *bus*.
+
+    Entries younger than *max_age* are reused, and concurrent callers
+    share one in-flight request. The returned dicts are shared — callers
+    must not modify them.
+    """
+    cached = _managed_objects.get(bus)
+    if cached is not None and time.monotonic() - cached[0] < max_age:
+        return cached
+    task = _managed_objects_inflight.get(bus)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_managed_objects(bus))
+        _managed_objects_inflight[bus] = task
+    # shield: one caller being cancelled must not cancel the shared fetch
+    return await asyncio.shield(task)
+
+
+async def _get_managed_objects(
+    bus: MessageBus, max_age: float = MANAGED_OBJECTS_MAX_AGE,
+) -> dict[str, dict[str, dict]]:
+    """Return a recent GetManagedObjects reply for *bus* (see _get_managed_entry)."""
+    return (await _get_managed_entry(bus, max_age))[1]
+
+
+# list_all() results (sorted, with sysfs hardware info) are reused for
+# this long; the adapters page polls it.
+ADAPTER_LIST_MAX_AGE = 1.0
+
+_adapter_lists = weakref.WeakKeyDictionary()  # MessageBus -> (monotonic, adapters)
+
+
+# Adapter1 proxies per bus, keyed by adapter path (e.g. /org/bluez/hci0)
+_adapter_ifaces = weakref.WeakKeyDictionary()  # MessageBus -> {path: ProxyInterface}
+
+
+async def _get_adapter_iface(bus: MessageBus, adapter_path: str):
+    """Return the (cached) org.bluez.Adapter1 interface for *adapter_path*."""
+    by_path = _adapter_ifaces.setdefault(bus, {})
+    iface = by_path.get(adapter_path)
+    if iface is None:
+        introspection = await bus.introspect(BLUEZ_SERVICE, adapter_path)
+        iface = bus.get_proxy_object(
+            BLUEZ_SERVICE, adapter_path, introspection
+        ).get_interface(ADAPTER_INTERFACE)
+        by_path[adapter_path] = iface
+    return iface
+
+
+# Interfaces whose property changes are applied to the mirror (the
+# Bearer ones feed get_audio_devices' "bearers"). The PropertiesChanged
+# rules are narrowed with arg0 so bluetoothd's other chatter
+# (MediaPlayer1 Position, GattCharacteristic1 Value, ...) is not routed
+# to this connection at all.
+_MIRRORED_PROPERTY_INTERFACES = (
+    DEVICE_INTERFACE, MEDIA_TRANSPORT_INTERFACE, ADAPTER_INTERFACE, *_BEARER_INTERFACES,
+)
+
+# Signals used to keep the managed-object mirror current
+_MATCH_RULES = (
+    f"type='signal',sender='{BLUEZ_SERVICE}',interface='{OBJECT_MANAGER_INTERFACE}'",
+    *(
+        f"type='signal',sender='{BLUEZ_SERVICE}',interface='{PROPERTIES_INTERFACE}',"
+        f"member='PropertiesChanged',arg0='{iface}'"
+        for iface in _MIRRORED_PROPERTY_INTERFACES
+    ),
+    "type='signal',sender='org.freedesktop.DBus',member='NameOwnerChanged',"
+    f"arg0='{BLUEZ_SERVICE}'",
+)
+
+
 class AdapterNotPoweredError(Exception):
     """Raised when the Bluetooth adapter is not powered on."""
 
@@ -62,6 +202,16 @@ class BluezAdapter:
         self._adapter_path = adapter_path
         self._adapter_iface = None
         self._properties_iface = None
+        self._adapter_props: dict[str, Variant] = {}  # Adapter1 GetAll from initialize()
+        self._obj_manager = None  # root ObjectManager, bound in initialize()
+        # In-memory mirror of GetManagedObjects, kept current from
+        # InterfacesAdded/InterfacesRemoved/PropertiesChanged signals.
+        # None = not loaded (or bluetoothd restarted); refetched on demand.
+        self._objects: dict[str, dict[str, dict]] | None = None
+        # device path -> its MediaTransport1 sub-paths (e.g. .../sep1/fd0)
+        self._transport_parents: dict[str, set[str]] = {}
+        self._bluez_owner: str | None = None  # unique bus name of bluetoothd
+        self._signal_backlog: list[Message] | None = None  # signals seen mid-fetch
         self._discovering = False
         self._rssi_refreshing = False
         # Tracks addresses already logged during this scan session,
@@ -81,16 +231,151 @@ class BluezAdapter:
         self._adapter_iface = proxy.get_interface(ADAPTER_INTERFACE)
         self._properties_iface = proxy.get_interface(PROPERTIES_INTERFACE)
 
-        powered = await self._properties_iface.call_get(ADAPTER_INTERFACE, "Powered")
-        if not powered.value:
+        self._adapter_props = await self._properties_iface.call_get_all(ADAPTER_INTERFACE)
+        powered = self._adapter_props.get("Powered")
+        if not (powered and powered.value):
             raise AdapterNotPoweredError(
                 "Bluetooth adapter is not powered. "
                 "Enable Bluetooth in HAOS settings — this app does not "
                 "modify adapter power state."
             )
 
-        address = await self._properties_iface.call_get(ADAPTER_INTERFACE, "Address")
-        logger.info("Adapter %s initialized at %s", address.value, self._adapter_path)
+        address = self._adapter_props.get("Address")
+        logger.info(
+            "Adapter %s initialized at %s",
+            address.value if address else "unknown", self._adapter_path,
+        )
+
+        self._obj_manager = await _get_object_manager(self._bus)
+
+        for rule in _MATCH_RULES:
+            await self._bus.call(
+                Message(
+                    destination="org.freedesktop.DBus",
+                    path="/org/freedesktop/DBus",
+                    interface="org.freedesktop.DBus",
+                    member="AddMatch",
+                    signature="s",
+                    body=[rule],
+                )
+            )
+        reply = await self._bus.call(
+            Message(
+                destination="org.freedesktop.DBus",
+                path="/org/freedesktop/DBus",
+                interface="org.freedesktop.DBus",
+                member="GetNameOwner",
+                signature="s",
+                body=[BLUEZ_SERVICE],
+            )
+        )
+        if reply.message_type == MessageType.METHOD_RETURN:
+            self._bluez_owner = reply.body[0]
+        self._bus.add_message_handler(self._on_bus_message)
+        await self.get_managed_objects()
+
+    def cleanup(self) -> None:
+        """Stop mirroring BlueZ signals and drop the managed-object mirror.
+
+        Call this before discarding a BluezAdapter so its bus hook does
+        not outlive it.
+        """
+        self._bus.remove_message_handler(self._on_bus_message)
+        self._objects = None
+        self._transport_parents = {}
+        self._signal_backlog = None
+
+    async def get_managed_objects(self) -> dict[str, dict[str, dict]]:
+        """Return BlueZ's managed objects (path → interface → properties).
+
+        Served from the signal-maintained mirror; only the first call (or
+        the first after bluetoothd restarts) goes over D-Bus. Property
+        updates are tracked for Device1, MediaTransport1, Adapter1 and
+        the Bearer interfaces only; other interfaces keep the values they
+        were added with.
+        The returned dict is shared — callers must not modify it.
+        """
+        if self._objects is not None:
+            return self._objects
+        # Buffer signals that arrive while the snapshot is in flight and
+        # replay them on top of it, so no update is lost.
+        self._signal_backlog = []
+        try:
+            objects = await self._obj_manager.call_get_managed_objects()
+            backlog, self._signal_backlog = self._signal_backlog, None
+        except BaseException:
+            self._signal_backlog = None
+            raise
+        self._objects = objects
+        transport_parents: dict[str, set[str]] = {}
+        for obj_path, ifaces in objects.items():
+            if MEDIA_TRANSPORT_INTERFACE in ifaces:
+                parent = _device_path_of(obj_path)
+                if parent:
+                    transport_parents.setdefault(parent, set()).add(obj_path)
+        self._transport_parents = transport_parents
+        for msg in backlog:
+            self._apply_signal(msg)
+        return objects
+
+    def _on_bus_message(self, msg: Message) -> bool:
+        """Message-bus hook: feed BlueZ object signals into the mirror."""
+        if msg.message_type != MessageType.SIGNAL:
+            return False
+        if msg.member == "NameOwnerChanged" and msg.interface == "org.freedesktop.DBus":
+            if msg.body and msg.body[0] == BLUEZ_SERVICE:
+                # bluetoothd restarted — everything we hold is stale
+                self._bluez_owner = msg.body[2] or None
+                self._objects = None
+                self._transport_parents = {}
+                invalidate_device_caches(self._bus)
+            return False
+        if msg.sender != self._bluez_owner:
+            return False
+        if self._objects is not None:
+            self._apply_signal(msg)
+        elif self._signal_backlog is not None:
+            self._signal_backlog.append(msg)
+        return False  # never consume; other handlers see it too
+
+    def _apply_signal(self, msg: Message) -> None:
+        """Apply one ObjectManager / PropertiesChanged signal to the mirror."""
+        objects = self._objects
+        if msg.interface == OBJECT_MANAGER_INTERFACE:
+            if msg.member == "InterfacesAdded" and len(msg.body) >= 2:
+                obj_path, added = msg.body[0], msg.body[1]
+                objects.setdefault(obj_path, {}).update(added)
+                if MEDIA_TRANSPORT_INTERFACE in added:
+                    parent = _device_path_of(obj_path)
+                    if parent:
+                        self._transport_parents.setdefault(parent, set()).add(obj_path)
+            elif msg.member == "InterfacesRemoved" and len(msg.body) >= 2:
+                obj_path, removed = msg.body[0], msg.body[1]
+                if DEVICE_INTERFACE in removed:
+                    forget_device_proxies(self._bus, obj_path)
+                ifaces = objects.get(obj_path)
+                if ifaces is not None:
+                    for name in removed:
+                        ifaces.pop(name, None)
+                    if not ifaces:
+                        del objects[obj_path]
+                if MEDIA_TRANSPORT_INTERFACE in removed:
+                    parent = _device_path_of(obj_path)
+                    transports = self._transport_parents.get(parent)
+                    if transports is not None:
+                        transports.discard(obj_path)
+                        if not transports:
+                            del self._transport_parents[parent]
+        elif msg.interface == PROPERTIES_INTERFACE and msg.member == "PropertiesChanged":
+            if len(msg.body) < 3:
+                return
+            iface_name, changed, invalidated = msg.body
+            props = objects.get(msg.path, {}).get(iface_name)
+            if props is None:
+                return
+            props.update(changed)
+            for name in invalidated:
+                props.pop(name, None)
 
     async def start_discovery(self) -> None:
         """Start unfiltered discovery on all transports (BR/EDR + BLE).
@@ -183,9 +468,9 @@ class BluezAdapter:
     async def get_audio_devices(self, *, cod_fallback: bool = False) -> list[dict]:
         """Enumerate discovered devices that can receive/play audio.
 
-        Uses ObjectManager to list all /org/bluez/hci0/dev_* objects
-        and filters for those with a sink-capable profile (A2DP Sink,
-        HFP, or HSP).  Devices that only advertise A2DP Source (e.g.
+        Reads the signal-maintained ObjectManager mirror (no D-Bus round
+        trip) for all /org/bluez/hci0/dev_* objects and filters for those
+        with a sink-capable profile (A2DP Sink, HFP, or HSP).  Devices that only advertise A2DP Source (e.g.
         phones) are excluded since this add-on manages speakers.
 
         When cod_fallback=True, devices with no UUIDs but an audio-sink
@@ -193,27 +478,28 @@ class BluezAdapter:
         during scan sessions to avoid surfacing stale BlueZ cache entries
         as ghost devices.
         """
-        introspection = await self._bus.introspect(BLUEZ_SERVICE, "/")
-        proxy = self._bus.get_proxy_object(BLUEZ_SERVICE, "/", introspection)
-        obj_manager = proxy.get_interface(OBJECT_MANAGER_INTERFACE)
-        objects = await obj_manager.call_get_managed_objects()
+        objects = await self.get_managed_objects()
+        transport_parents = self._transport_parents
+        logged_cache = self._logged_cache
+        # Hot-loop constants bound to locals (LOAD_FAST, not LOAD_GLOBAL)
+        device_iface = DEVICE_INTERFACE
+        sink_uuids = SINK_UUIDS
+        bearer_prefix, bearer_prefix_len = _BEARER_PREFIX, _BEARER_PREFIX_LEN
 
         devices = []
         skipped = 0
         cod_accepted = 0
         for path, interfaces in objects.items():
-            if DEVICE_INTERFACE not in interfaces:
+            if device_iface not in interfaces:
                 continue
 
-            props = interfaces[DEVICE_INTERFACE]
-            uuids_variant = props.get("UUIDs")
-            uuids = set(uuids_variant.value) if uuids_variant else set()
+            props = interfaces[device_iface]
+            uuid_list = _prop(props, "UUIDs", ())
 
             # Read Class of Device for diagnostics and CoD fallback
-            class_variant = props.get("Class")
-            cod_raw = class_variant.value if class_variant else 0
+            cod_raw = _prop(props, "Class", 0)
 
-            uuid_matched = bool(uuids.intersection(SINK_UUIDS))
+            uuid_matched = not sink_uuids.isdisjoint(uuid_list)
 
             # CoD fallback (scan-only): device advertises no UUIDs but
             # has an audio-sink CoD (headphones, speaker, etc.).  These
@@ -223,22 +509,21 @@ class BluezAdapter:
             cod_matched = (
                 cod_fallback
                 and not uuid_matched
-                and not uuids
+                and not uuid_list
                 and is_cod_audio_sink(cod_raw)
             )
 
             if not uuid_matched and not cod_matched:
                 skipped += 1
-                addr_v = props.get("Address")
-                addr = addr_v.value if addr_v else "??:??"
-                name_v = props.get("Name")
-                name = name_v.value if name_v else "unknown"
+                addr = _prop(props, "Address", "??:??")
+                name = _prop(props, "Name", "unknown")
                 # User scans (cod_fallback=True): log at INFO, dedup via cache.
                 # Background calls: log at DEBUG, don't populate cache so
                 # they can't steal dedup slots from the next user scan.
-                if addr not in self._logged_cache:
+                if addr not in logged_cache:
                     if cod_fallback:
-                        self._logged_cache.add(addr)
+                        logged_cache.add(addr)
+                    uuids = set(uuid_list)
                     reason = _classify_rejection(uuids)
                     cod_str = (
                         f"0x{cod_raw:06X}({cod_major_label(cod_raw)})"
@@ -256,21 +541,15 @@ class BluezAdapter:
             if cod_matched:
                 cod_accepted += 1
 
-            address_variant = props.get("Address")
-            name_variant = props.get("Name")
-            paired_variant = props.get("Paired")
-            connected_variant = props.get("Connected")
-            rssi_variant = props.get("RSSI")
-
-            paired = paired_variant.value if paired_variant else False
-            connected = connected_variant.value if connected_variant else False
-            rssi = rssi_variant.value if rssi_variant else None
+            address = _prop(props, "Address", "unknown")
+            name = _prop(props, "Name", "Unknown Device")
+            paired = _prop(props, "Paired", False)
+            connected = _prop(props, "Connected", False)
+            rssi = _prop(props, "RSSI")
 
             # Log accepted devices once per scan so the full picture is visible
-            addr = address_variant.value if address_variant else "??:??"
-            name = name_variant.value if name_variant else "unknown"
-            if addr not in self._logged_cache:
-                self._logged_cache.add(addr)
+            if address not in logged_cache:
+                logged_cache.add(address)
                 cod_str = (
                     f"0x{cod_raw:06X}({cod_major_label(cod_raw)})"
                     if cod_raw else "(none)"
@@ -285,53 +564,48 @@ class BluezAdapter:
                     logger.info(
                         "Accepted device %s (%s) [%s] — CoD fallback %s. "
                         "UUIDs will resolve after pairing.",
-                        name, addr, state, cod_str,
+                        name, address, state, cod_str,
                     )
                 else:
-                    matched = sorted(uuids.intersection(SINK_UUIDS))
                     logger.info(
                         "Accepted device %s (%s) [%s] — matched %s. CoD: %s",
-                        name, addr, state, matched, cod_str,
+                        name, address, state, sorted(sink_uuids.intersection(uuid_list)), cod_str,
                     )
 
             # Detect active bearers (BR/EDR vs LE)
             bearers = []
             for iface_name in interfaces:
-                if not iface_name.startswith("org.bluez.Bearer."):
+                if not iface_name.startswith(bearer_prefix):
                     continue
                 bearer_props = interfaces[iface_name]
                 conn_var = bearer_props.get("Connected")
-                if conn_var and (conn_var.value if hasattr(conn_var, "value") else conn_var):
+                if conn_var and conn_var.value:
                     # e.g. "org.bluez.Bearer.BREDR1" → "BR/EDR"
-                    short = iface_name.rsplit(".", 1)[-1]  # "BREDR1", "LE1"
-                    if "BREDR" in short:
+                    short = iface_name[bearer_prefix_len:]  # "BREDR1", "LE1"
+                    if short.startswith("BREDR"):
                         bearers.append("BR/EDR")
-                    elif "LE" in short:
+                    elif short.startswith("LE"):
                         bearers.append("LE")
                     else:
                         bearers.append(short)
 
-            # Check for MediaTransport1 at sub-paths (e.g. .../fd0)
-            has_transport = False
-            dev_fragment = path + "/"
-            for obj_path in objects:
-                if obj_path.startswith(dev_fragment) and "org.bluez.MediaTransport1" in objects[obj_path]:
-                    has_transport = True
-                    break
+            # MediaTransport1 at a sub-path (e.g. .../sep1/fd0)
+            has_transport = path in transport_parents
 
             # Extract adapter name from path: /org/bluez/hci0/dev_XX → hci0
-            adapter_name = path.split("/")[3] if len(path.split("/")) > 3 else "unknown"
+            parts = path.split("/", 4)
+            adapter_name = parts[3] if len(parts) > 3 else "unknown"
 
             devices.append(
                 {
                     "path": path,
                     "adapter": adapter_name,
-                    "address": address_variant.value if address_variant else "unknown",
-                    "name": name_variant.value if name_variant else "Unknown Device",
+                    "address": address,
+                    "name": name,
                     "paired": paired,
                     "connected": connected,
                     "rssi": rssi,
-                    "uuids": list(uuids),
+                    "uuids": list(uuid_list),
                     "bearers": bearers,
                     "has_transport": has_transport,
                     "cod_matched": cod_matched,
@@ -351,7 +625,6 @@ class BluezAdapter:
             logger.info("get_audio_devices: %s", ", ".join(parts))
         return devices
 
-
     async def remove_device(self, device_path: str) -> None:
         """Remove a device from the adapter (unpair)."""
         try:
@@ -360,6 +633,28 @@ class BluezAdapter:
         except DBusError as e:
             logger.warning("Failed to remove device %s: %s", device_path, e)
 
+    @staticmethod
+    async def get_object_manager(bus: MessageBus):
+        """Return the shared ObjectManager interface on BlueZ's root object.
+
+        The proxy is built once per bus; each call_get_managed_objects()
+        on it is still a fresh D-Bus call.
+        """
+        return await _get_object_manager(bus)
+
+    @staticmethod
+    async def find_device_adapters(bus: MessageBus, address: str) -> list[str]:
+        """Return the path of every adapter holding a device object for *address*.
+
+        Looks the address up in the indexed GetManagedObjects snapshot, so
+        resolving several devices in a row costs one D-Bus call.
+        """
+        _, _, device_paths = await _get_managed_entry(bus)
+        return [
+            adapter_path
+            for adapter_path, _ in device_paths.get(f"dev_{address.replace(':', '_')}", ())
+        ]
+
     @staticmethod
     async def remove_device_any_adapter(bus: MessageBus, address: str) -> bool:
         """Find and remove a device from ALL adapters that have it.
@@ -368,28 +663,26 @@ class BluezAdapter:
         MAC address and calls RemoveDevice on every owning adapter.
         Returns True if the device was removed from at least one adapter.
         """
-        dev_suffix = f"/dev_{address.replace(':', '_')}"
-        introspection = await bus.introspect(BLUEZ_SERVICE, "/")
-        proxy = bus.get_proxy_object(BLUEZ_SERVICE, "/", introspection)
-        obj_manager = proxy.get_interface(OBJECT_MANAGER_INTERFACE)
-        objects = await obj_manager.call_get_managed_objects()
+        _, _, device_paths = await _get_managed_entry(bus)
+        paths = device_paths.get(f"dev_{address.replace(':', '_')}", ())
 
-        removed_any = False
-        for path in list(objects):
-            if not path.endswith(dev_suffix):
-                continue
-            # Found the device — extract adapter path (e.g. /org/bluez/hci0)
-            adapter_path = path[: path.rfind("/")]
+        async def _remove(adapter_path: str, path: str) -> bool:
             try:
-                intr = await bus.introspect(BLUEZ_SERVICE, adapter_path)
-                adapter_proxy = bus.get_proxy_object(BLUEZ_SERVICE, adapter_path, intr)
-                adapter_iface = adapter_proxy.get_interface(ADAPTER_INTERFACE)
+                adapter_iface = await _get_adapter_iface(bus, adapter_path)
                 await adapter_iface.call_remove_device(path)
                 logger.info("Removed device %s from adapter %s", path, adapter_path)
-                removed_any = True
+                return True
             except DBusError as e:
                 logger.warning("Failed to remove %s from %s: %s", path, adapter_path, e)
-        if not removed_any:
+                return False
+
+        results = await asyncio.gather(
+            *(_remove(adapter_path, path) for adapter_path, path in paths)
+        )
+        removed_any = any(results)
+        if removed_any:
+            _managed_objects.pop(bus, None)  # the cached reply still lists it
+        else:
             logger.warning("Device %s not found on any adapter", address)
         return removed_any
 
@@ -467,6 +760,14 @@ class BluezAdapter:
             pass
         return None
 
+    @staticmethod
+    def _read_sysfs_info(hci_name: str) -> tuple[str | None, str | None]:
+        """Return (hw_model, usb_id) for a BT adapter; blocking, run in a thread."""
+        return (
+            BluezAdapter._read_sysfs_hw_info(hci_name),
+            BluezAdapter._read_sysfs_usb_id(hci_name),
+        )
+
     @staticmethod
     async def list_all(bus: MessageBus) -> list[dict]:
         """Enumerate all Bluetooth adapters on the system.
@@ -474,31 +775,36 @@ class BluezAdapter:
         Returns a list of dicts with adapter info including path, address,
         name, powered state, hardware model, and whether discovery is
         active (indicating HA BLE scanning).
+
+        The sorted result is reused for ADAPTER_LIST_MAX_AGE seconds, which
+        also skips the sysfs walk; callers get their own dict copies.
         """
-        introspection = await bus.introspect(BLUEZ_SERVICE, "/")
-        proxy = bus.get_proxy_object(BLUEZ_SERVICE, "/", introspection)
-        obj_manager = proxy.get_interface(OBJECT_MANAGER_INTERFACE)
-        objects = await obj_manager.call_get_managed_objects()
+        cached = _adapter_lists.get(bus)
+        if cached is not None and time.monotonic() - cached[0] < ADAPTER_LIST_MAX_AGE:
+            return [dict(a) for a in cached[1]]
+
+        objects = await _get_managed_objects(bus)
+
+        found = [
+            (path, interfaces[ADAPTER_INTERFACE])
+            for path, interfaces in objects.items()
+            if ADAPTER_INTERFACE in interfaces
+        ]
+        hci_names = [path.rsplit("/", 1)[-1] for path, _ in found]  # e.g. "hci0"
+
+        # sysfs reads are blocking file I/O; run them off the event loop,
+        # all adapters concurrently.
+        sysfs_info = await asyncio.gather(*(
+            asyncio.to_thread(BluezAdapter._read_sysfs_info, hci_name)
+            for hci_name in hci_names
+        ))
 
         adapters = []
-        for path, interfaces in objects.items():
-            if ADAPTER_INTERFACE not in interfaces:
-                continue
-            props = interfaces[ADAPTER_INTERFACE]
+        for (path, props), hci_name, (hw_model, usb_id) in zip(found, hci_names, sysfs_info):
 
             def _val(key, _props=props):
                 v = _props.get(key)
-                if v is None:
-                    return None
-                return v.value if hasattr(v, "value") else v
-
-            hci_name = path.rsplit("/", 1)[-1]  # e.g. "hci0"
-
-            # Try to get hardware model from sysfs (USB manufacturer + product)
-            hw_model = BluezAdapter._read_sysfs_hw_info(hci_name)
-
-            # Read real USB vendor:product ID from sysfs
-            usb_id = BluezAdapter._read_sysfs_usb_id(hci_name)
+                return v.value if v is not None else None
 
             # Fall back to BlueZ Modalias property (e.g. "usb:v0A12p0001d0678")
             modalias = _val("Modalias") or ""
@@ -519,4 +825,5 @@ class BluezAdapter:
 
         # Sort by path so hci0 comes first
         adapters.sort(key=lambda a: a["path"])
-        return adapters
+        _adapter_lists[bus] = (time.monotonic(), adapters)
+        return [dict(a) for a in adapters]
@@ -1,5 +1,6 @@
 """BlueZ Agent1 D-Bus implementation for automated audio device pairing."""
 
+import asyncio
 import logging
 
 from dbus_next import BusType
@@ -60,19 +61,31 @@ class PairingAgent:
         self._bus = bus
         self._agent = AgentInterface()
         self._registered = False
+        self._agent_manager = None  # AgentManager1 proxy, introspected once
+
+    async def _get_agent_manager(self):
+        """Return the org.bluez.AgentManager1 interface, introspecting on first use."""
+        if self._agent_manager is None:
+            introspection = await self._bus.introspect(BLUEZ_SERVICE, "/org/bluez")
+            proxy = self._bus.get_proxy_object(
+                BLUEZ_SERVICE, "/org/bluez", introspection
+            )
+            self._agent_manager = proxy.get_interface(AGENT_MANAGER_INTERFACE)
+        return self._agent_manager
 
     async def register(self) -> None:
         """Export the agent interface and register with BlueZ."""
         self._bus.export(AGENT_PATH, self._agent)
 
-        introspection = await self._bus.introspect(BLUEZ_SERVICE, "/org/bluez")
-        proxy = self._bus.get_proxy_object(
-            BLUEZ_SERVICE, "/org/bluez", introspection
-        )
-        agent_manager = proxy.get_interface(AGENT_MANAGER_INTERFACE)
+        agent_manager = await self._get_agent_manager()
 
-        await agent_manager.call_register_agent(AGENT_PATH, AGENT_CAPABILITY)
-        await agent_manager.call_request_default_agent(AGENT_PATH)
+        # Both calls go out back-to-back on the same connection; D-Bus
+        # preserves per-connection ordering, so bluetoothd still sees
+        # RegisterAgent before RequestDefaultAgent.
+        await asyncio.gather(
+            agent_manager.call_register_agent(AGENT_PATH, AGENT_CAPABILITY),
+            agent_manager.call_request_default_agent(AGENT_PATH),
+        )
         self._registered = True
         logger.info(
             "Pairing agent registered at %s (capability: %s)",
@@ -85,11 +98,7 @@ class PairingAgent:
         if not self._registered:
             return
         try:
-            introspection = await self._bus.introspect(BLUEZ_SERVICE, "/org/bluez")
-            proxy = self._bus.get_proxy_object(
-                BLUEZ_SERVICE, "/org/bluez", introspection
-            )
-            agent_manager = proxy.get_interface(AGENT_MANAGER_INTERFACE)
+            agent_manager = await self._get_agent_manager()
             await agent_manager.call_unregister_agent(AGENT_PATH)
         except DBusError as e:
             logger.debug("Agent unregister failed (may already be gone): %s", e)
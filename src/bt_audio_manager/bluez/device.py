@@ -3,6 +3,7 @@
 import asyncio
 import logging
 import time
+import weakref
 from typing import Callable
 from xml.etree import ElementTree as ET
 
@@ -20,6 +21,34 @@ logger = logging.getLogger(__name__)
 
 MEDIA_PLAYER_INTERFACE = "org.bluez.MediaPlayer1"
 
+# (Device1, Properties) proxy interfaces per bus and device path, so a
+# BluezDevice rebuilt for the same device skips re-introspection.
+# Entries are dropped via forget_device_proxies() when BlueZ removes
+# the device object.
+_device_proxies = weakref.WeakKeyDictionary()  # MessageBus -> {path: (iface, iface)}
+
+# Initialized BluezDevice instances per bus and device path, so their
+# Device1 property caches can be dropped when the object goes away.
+_live_devices = weakref.WeakKeyDictionary()  # MessageBus -> {path: WeakSet[BluezDevice]}
+
+_INVALIDATED = object()  # marks a property invalidated while GetAll is in flight
+
+
+def forget_device_proxies(bus: MessageBus, path: str) -> None:
+    """Drop the cached proxy interfaces and properties for a removed device object."""
+    by_path = _device_proxies.get(bus)
+    if by_path is not None:
+        by_path.pop(path, None)
+    for device in list(_live_devices.get(bus, {}).get(path, ())):
+        device._invalidate_cache()
+
+
+def invalidate_device_caches(bus: MessageBus) -> None:
+    """Drop every device's cached properties, e.g. after bluetoothd restarted."""
+    for devices in list(_live_devices.get(bus, {}).values()):
+        for device in list(devices):
+            device._invalidate_cache()
+
 
 def address_to_path(address: str, adapter_path: str = DEFAULT_ADAPTER_PATH) -> str:
     """Convert a MAC address to a BlueZ D-Bus object path."""
@@ -40,17 +69,36 @@ class BluezDevice:
         self._avrcp_callbacks: list[Callable] = []
         self._player_path: str | None = None
         self._properties_changed_unsub = None
+        # Device1 properties (unwrapped), seeded by one GetAll and kept
+        # current from PropertiesChanged so reads need no D-Bus round-trip.
+        self._props_cache: dict = {}
+        self._props_epoch = 0  # bumped on invalidation; stale GetAll replies are dropped
+        # One buffer per GetAll in flight, collecting changes signalled meanwhile
+        self._props_pending: list[dict] = []
+        # Set whenever ServicesResolved or Connected changes; wakes wait_for_services()
+        self._services_changed = asyncio.Event()
+        self._callback_tasks: set[asyncio.Task] = set()  # async callbacks in flight
         self._avrcp_last_search: float = 0.0  # monotonic timestamp of last failed search
         self._avrcp_cooldown: float = 60.0  # seconds to wait before searching again
 
     async def initialize(self) -> None:
         """Connect to the device's D-Bus interfaces and start monitoring."""
-        introspection = await self._bus.introspect(BLUEZ_SERVICE, self._path)
-        proxy = self._bus.get_proxy_object(BLUEZ_SERVICE, self._path, introspection)
-        self._device_iface = proxy.get_interface(DEVICE_INTERFACE)
-        self._properties_iface = proxy.get_interface(PROPERTIES_INTERFACE)
+        by_path = _device_proxies.setdefault(self._bus, {})
+        cached = by_path.get(self._path)
+        if cached is None:
+            introspection = await self._bus.introspect(BLUEZ_SERVICE, self._path)
+            proxy = self._bus.get_proxy_object(BLUEZ_SERVICE, self._path, introspection)
+            cached = (
+                proxy.get_interface(DEVICE_INTERFACE),
+                proxy.get_interface(PROPERTIES_INTERFACE),
+            )
+            by_path[self._path] = cached
+        self._device_iface, self._properties_iface = cached
 
         self._properties_iface.on_properties_changed(self._on_properties_changed)
+        _live_devices.setdefault(self._bus, {}).setdefault(
+            self._path, weakref.WeakSet()
+        ).add(self)
         logger.debug("Device %s initialized at %s", self._address, self._path)
 
     def cleanup(self) -> None:
@@ -65,6 +113,10 @@ class BluezDevice:
         self._avrcp_callbacks.clear()
         self._player_path = None
         self._avrcp_last_search = 0.0
+        devices = _live_devices.get(self._bus, {}).get(self._path)
+        if devices is not None:
+            devices.discard(self)
+        self._invalidate_cache()
         logger.debug("Device %s cleaned up", self._address)
 
     def reset_avrcp_watch(self) -> None:
@@ -79,16 +131,43 @@ class BluezDevice:
         if interface_name != DEVICE_INTERFACE:
             return
 
+        if self._props_cache:
+            for name, variant in changed.items():
+                self._props_cache[name] = variant.value
+            for name in invalidated:
+                self._props_cache.pop(name, None)
+        for pending in self._props_pending:
+            for name, variant in changed.items():
+                pending[name] = variant.value
+            pending.update(dict.fromkeys(invalidated, _INVALIDATED))
+        if "ServicesResolved" in changed or "Connected" in changed:
+            self._services_changed.set()
+
         if "Connected" in changed:
             connected = changed["Connected"].value
             if not connected:
                 logger.info("Device %s disconnected", self._address)
-                for cb in self._disconnect_callbacks:
-                    cb(self._address)
+                self._dispatch(self._disconnect_callbacks, self._address)
             else:
                 logger.info("Device %s connected", self._address)
-                for cb in self._connect_callbacks:
-                    cb(self._address)
+                self._dispatch(self._connect_callbacks, self._address)
+
+    def _dispatch(self, callbacks: list[Callable], *args) -> None:
+        """Invoke subscriber callbacks without letting one block or break the rest.
+
+        Coroutine callbacks are scheduled as tasks so the D-Bus signal
+        handler returns immediately; exceptions are logged per callback.
+        """
+        for cb in callbacks:
+            try:
+                result = cb(*args)
+            except Exception:
+                logger.exception("Callback %r failed for %s", cb, self._address)
+                continue
+            if asyncio.iscoroutine(result):
+                task = asyncio.get_running_loop().create_task(result)
+                self._callback_tasks.add(task)
+                task.add_done_callback(self._callback_tasks.discard)
 
     def on_disconnected(self, callback: Callable[[str], None]) -> None:
         """Register a callback for when this device disconnects."""
@@ -176,8 +255,7 @@ class BluezDevice:
                     for prop_name, variant in all_props.items():
                         val = variant.value
                         logger.info("AVRCP %s initial: %s = %s", self._address, prop_name, val)
-                        for cb in self._avrcp_callbacks:
-                            cb(self._address, prop_name, val)
+                        self._dispatch(self._avrcp_callbacks, self._address, prop_name, val)
                 except DBusError as e:
                     logger.debug("Could not read initial AVRCP state: %s", e)
 
@@ -209,8 +287,7 @@ class BluezDevice:
             if prop_name == "Track" and isinstance(val, dict):
                 val = {k: (v.value if hasattr(v, "value") else v) for k, v in val.items()}
             logger.info("AVRCP %s: %s = %s", self._address, prop_name, val)
-            for cb in self._avrcp_callbacks:
-                cb(self._address, prop_name, val)
+            self._dispatch(self._avrcp_callbacks, self._address, prop_name, val)
 
     async def pair(self) -> None:
         """Initiate pairing with the device."""
@@ -263,11 +340,54 @@ class BluezDevice:
         await self._device_iface.call_disconnect_profile(uuid)
         logger.info("DisconnectProfile %s on %s succeeded", uuid, self._address)
 
+    def _invalidate_cache(self) -> None:
+        """Forget cached Device1 properties; the next read reloads them."""
+        self._props_cache = {}
+        self._props_epoch += 1
+
+    async def _load_props(self) -> dict:
+        """GetAll Device1 into the cache.
+
+        Changes signalled while the call is in flight are newer than its
+        reply, so they are buffered and applied on top of it.
+        """
+        epoch = self._props_epoch
+        pending: dict = {}
+        self._props_pending.append(pending)
+        try:
+            result = await self._properties_iface.call_get_all(DEVICE_INTERFACE)
+        finally:
+            self._props_pending.remove(pending)
+        props = {k: v.value for k, v in result.items()}
+        for name, value in pending.items():
+            if value is _INVALIDATED:
+                props.pop(name, None)
+            else:
+                props[name] = value
+        if epoch == self._props_epoch:
+            self._props_cache = props
+        return props
+
+    async def _ensure_cache(self) -> dict:
+        """Return the Device1 property cache, loading it with one GetAll if empty."""
+        if not self._props_cache:
+            return await self._load_props()
+        return self._props_cache
+
+    async def _get_prop(self, name: str):
+        """Read one Device1 property, from the cache when possible."""
+        cache = await self._ensure_cache()
+        if name in cache:
+            return cache[name]
+        result = await self._properties_iface.call_get(DEVICE_INTERFACE, name)
+        cache[name] = result.value
+        return result.value
+
     async def get_uuids(self) -> list[str]:
         """Get the list of service UUIDs advertised by the device."""
         try:
-            result = await self._properties_iface.call_get(DEVICE_INTERFACE, "UUIDs")
-            return list(result.value) if result.value else []
+            uuids = await self._get_prop("UUIDs")
+            return list(uuids) if uuids else []
         except DBusError:
             return []
 
@@ -280,47 +400,51 @@ class BluezDevice:
             logger.debug("Disconnect from %s failed: %s", self._address, e)
 
     async def wait_for_services(self, timeout: float = 10.0) -> bool:
-        """Wait for ServicesResolved to become True after connecting."""
-        deadline = asyncio.get_event_loop().time() + timeout
-        while asyncio.get_event_loop().time() < deadline:
-            resolved = await self._properties_iface.call_get(
-                DEVICE_INTERFACE, "ServicesResolved"
-            )
-            if resolved.value:
+        """Wait for ServicesResolved to become True after connecting.
+
+        Woken by the PropertiesChanged subscription from initialize()
+        rather than polling the property.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            # Clear before reading so a change landing in between still wakes us
+            self._services_changed.clear()
+            props = await self._ensure_cache()
+            if props.get("ServicesResolved"):
                 return True
             # Bail out early if device disconnected
-            connected = await self._properties_iface.call_get(
-                DEVICE_INTERFACE, "Connected"
-            )
-            if not connected.value:
+            if not props.get("Connected"):
                 logger.warning("Device %s disconnected while waiting for services", self._address)
                 return False
-            await asyncio.sleep(0.5)
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                await asyncio.wait_for(self._services_changed.wait(), remaining)
+            except asyncio.TimeoutError:
+                break
         logger.warning("Services not resolved for %s within %ss", self._address, timeout)
         return False
 
     async def is_paired(self) -> bool:
         """Check if the device is paired."""
-        result = await self._properties_iface.call_get(DEVICE_INTERFACE, "Paired")
-        return result.value
+        return await self._get_prop("Paired")
 
     async def is_connected(self) -> bool:
         """Check if the device is connected."""
-        result = await self._properties_iface.call_get(DEVICE_INTERFACE, "Connected")
-        return result.value
+        return await self._get_prop("Connected")
 
     async def get_name(self) -> str:
         """Get the device's friendly name."""
         try:
-            result = await self._properties_iface.call_get(DEVICE_INTERFACE, "Name")
-            return result.value
+            return await self._get_prop("Name")
         except DBusError:
             return "Unknown Device"
 
     async def get_properties(self) -> dict:
         """Get all Device1 properties."""
-        result = await self._properties_iface.call_get_all(DEVICE_INTERFACE)
-        return {k: v.value for k, v in result.items()}
+        return dict(await self._load_props())
 
     @property
     def address(self) -> str:
@@ -8,10 +8,13 @@ org.bluez.Media1.RegisterPlayer().
 The speaker buttons then appear as events in the app's UI.
 """
 
+import asyncio
 import logging
 from typing import Callable
+from xml.etree import ElementTree as ET
 
 from dbus_next import Variant
+from dbus_next import introspection as intr
 from dbus_next.aio import MessageBus
 from dbus_next.errors import DBusError
 from dbus_next.service import PropertyAccess, ServiceInterface, method, dbus_property, signal
@@ -20,6 +23,90 @@ from .constants import BLUEZ_SERVICE, DEFAULT_ADAPTER_PATH, MEDIA_INTERFACE, PLA
 
 logger = logging.getLogger(__name__)
 
+# Volume writes arriving within this window (e.g. a speaker's volume
+# slider being dragged) are reported once, with the final level.
+VOLUME_DEBOUNCE = 0.075
+
+# Constant for the add-on's lifetime; shared by the Metadata getter
+# and RegisterPlayer rather than rebuilt on every read.
+_METADATA = {
+    "xesam:title": Variant("s", "Home Assistant Audio"),
+    "xesam:artist": Variant("as", [""]),
+    "mpris:length": Variant("x", 0),
+}
+
+# The only part of the adapter's introspection we use. Supplying it
+# statically saves introspecting the adapter object (a multi-KB reply)
+# just to build the Media1 proxy.
+_MEDIA1_NODE = intr.Node.parse(f"""<node>
+  <interface name="{MEDIA_INTERFACE}">
+    <method name="RegisterPlayer">
+      <arg name="player" type="o" direction="in"/>
+      <arg name="properties" type="a{{sv}}" direction="in"/>
+    </method>
+    <method name="UnregisterPlayer">
+      <arg name="player" type="o" direction="in"/>
+    </method>
+  </interface>
+</node>""")
+
+# Properties whose value never changes after registration. They are
+# annotated EmitsChangedSignal=const so clients can cache them instead
+# of re-reading (dbus-next has no per-property annotation support).
+_CONST_PROPS = frozenset({
+    "LoopStatus", "Rate", "Shuffle", "Metadata",
+    "MinimumRate", "MaximumRate", "CanGoNext", "CanGoPrevious",
+    "CanPlay", "CanPause", "CanSeek", "CanControl",
+})
+# MPRIS defines Position as changing continuously without signals
+# (EmitsChangedSignal=false): clients must Get it each time they need it.
+_UNSIGNALLED_PROPS = frozenset({"Position"})
+_EMITS_CHANGED_SIGNAL = "org.freedesktop.DBus.Property.EmitsChangedSignal"
+
+
+class _ConstPropsInterface(intr.Interface):
+    """Introspection data carrying the EmitsChangedSignal annotations.
+
+    _CONST_PROPS are marked ``const`` and _UNSIGNALLED_PROPS ``false``.
+    """
+
+    def to_xml(self) -> ET.Element:
+        element = super().to_xml()
+        for prop in element.iter("property"):
+            name = prop.get("name")
+            if name in _CONST_PROPS:
+                ET.SubElement(prop, "annotation", name=_EMITS_CHANGED_SIGNAL, value="const")
+            elif name in _UNSIGNALLED_PROPS:
+                ET.SubElement(prop, "annotation", name=_EMITS_CHANGED_SIGNAL, value="false")
+        return element
+
+
+# PropertiesChanged payloads for each PlaybackStatus, reused per emit
+_STATUS_CHANGED = {
+    status: {"PlaybackStatus": status}
+    for status in ("Playing", "Paused", "Stopped")
+}
+
+
+# Initial player properties passed to Media1.RegisterPlayer
+_INITIAL_PLAYER_PROPS = {
+    "PlaybackStatus": Variant("s", "Stopped"),
+    "LoopStatus": Variant("s", "None"),
+    "Rate": Variant("d", 1.0),
+    "Shuffle": Variant("b", False),
+    "Metadata": Variant("a{sv}", _METADATA),
+    "Volume": Variant("d", 1.0),
+    "Position": Variant("x", 0),
+    "MinimumRate": Variant("d", 1.0),
+    "MaximumRate": Variant("d", 1.0),
+    "CanGoNext": Variant("b", True),
+    "CanGoPrevious": Variant("b", True),
+    "CanPlay": Variant("b", True),
+    "CanPause": Variant("b", True),
+    "CanSeek": Variant("b", False),
+    "CanControl": Variant("b", True),
+}
+
 
 class MPRISPlayerInterface(ServiceInterface):
     """D-Bus implementation of org.mpris.MediaPlayer2.Player.
@@ -28,43 +115,65 @@ class MPRISPlayerInterface(ServiceInterface):
     commands from a connected Bluetooth speaker/headset.
     """
 
+    # ServiceInterface keeps a __dict__, so these slots only speed up
+    # the attributes read on every AVRCP call.
+    __slots__ = ("_callback", "_playback_status", "_volume", "_volume_pct", "_volume_handle")
+
+    # Introspection data depends only on the decorated members, so it is
+    # built on first Introspect and shared by every player instance.
+    _introspection: intr.Interface | None = None
+
     def __init__(self, command_callback: Callable[[str, str], None]):
         super().__init__("org.mpris.MediaPlayer2.Player")
         self._callback = command_callback
         self._playback_status = "Stopped"
         self._volume = 1.0
+        self._volume_pct = 100
+        self._volume_handle: asyncio.TimerHandle | None = None
+
+    def introspect(self) -> intr.Interface:
+        cls = type(self)
+        if cls._introspection is None:
+            base = super().introspect()
+            cls._introspection = _ConstPropsInterface(
+                base.name, base.methods, base.signals, base.properties,
+            )
+        return cls._introspection
+
+    def _update_status(self, status: str) -> bool:
+        """Set PlaybackStatus, emitting PropertiesChanged only if it changed."""
+        if status == self._playback_status:
+            return False
+        self._playback_status = status
+        self.emit_properties_changed(
+            _STATUS_CHANGED.get(status) or {"PlaybackStatus": status}
+        )
+        return True
 
     # -- AVRCP command handlers (BlueZ calls these) --
 
     @method()
     def Play(self) -> None:
         logger.info("MPRIS command: Play")
-        self._playback_status = "Playing"
-        self.emit_properties_changed({"PlaybackStatus": self._playback_status})
+        self._update_status("Playing")
         self._callback("Play", "")
 
     @method()
     def Pause(self) -> None:
         logger.info("MPRIS command: Pause")
-        self._playback_status = "Paused"
-        self.emit_properties_changed({"PlaybackStatus": self._playback_status})
+        self._update_status("Paused")
         self._callback("Pause", "")
 
     @method()
     def PlayPause(self) -> None:
-        if self._playback_status == "Playing":
-            self._playback_status = "Paused"
-        else:
-            self._playback_status = "Playing"
+        self._update_status("Paused" if self._playback_status == "Playing" else "Playing")
         logger.info("MPRIS command: PlayPause -> %s", self._playback_status)
-        self.emit_properties_changed({"PlaybackStatus": self._playback_status})
         self._callback("PlayPause", self._playback_status)
 
     @method()
     def Stop(self) -> None:
         logger.info("MPRIS command: Stop")
-        self._playback_status = "Stopped"
-        self.emit_properties_changed({"PlaybackStatus": self._playback_status})
+        self._update_status("Stopped")
         self._callback("Stop", "")
 
     @method()
@@ -122,11 +231,7 @@ class MPRISPlayerInterface(ServiceInterface):
 
     @dbus_property(access=PropertyAccess.READ)
     def Metadata(self) -> "a{sv}":
-        return {
-            "xesam:title": Variant("s", "Home Assistant Audio"),
-            "xesam:artist": Variant("as", [""]),
-            "mpris:length": Variant("x", 0),
-        }
+        return _METADATA
 
     @dbus_property()
     def Volume(self) -> "d":
@@ -134,11 +239,21 @@ class MPRISPlayerInterface(ServiceInterface):
 
     @Volume.setter
     def Volume(self, val: "d"):
-        old = self._volume
         self._volume = max(0.0, min(1.0, val))
-        if abs(old - self._volume) > 0.01:
-            logger.info("MPRIS command: Volume %.0f%%", self._volume * 100)
-            self._callback("Volume", f"{self._volume * 100:.0f}%")
+        pct = int(self._volume * 100 + 0.5)
+        if pct == self._volume_pct:
+            return
+        self._volume_pct = pct
+        logger.debug("MPRIS command: Volume %d%%", pct)
+        if self._volume_handle is None:
+            self._volume_handle = asyncio.get_running_loop().call_later(
+                VOLUME_DEBOUNCE, self._flush_volume,
+            )
+
+    def _flush_volume(self) -> None:
+        """Report the latest Volume once the debounce window closes."""
+        self._volume_handle = None
+        self._callback("Volume", f"{self._volume_pct}%")
 
     @dbus_property(access=PropertyAccess.READ)
     def Position(self) -> "x":
@@ -182,11 +297,8 @@ class MPRISPlayerInterface(ServiceInterface):
         Called by the manager when the A2DP transport becomes active so the
         speaker knows playback is in progress and enables AVRCP volume buttons.
         """
-        if status == self._playback_status:
-            return
-        self._playback_status = status
-        self.emit_properties_changed({"PlaybackStatus": status})
-        logger.info("MPRIS PlaybackStatus set to %s (programmatic)", status)
+        if self._update_status(status):
+            logger.info("MPRIS PlaybackStatus set to %s (programmatic)", status)
 
     @signal()
     def Seeked(self) -> "x":
@@ -200,6 +312,10 @@ class AVRCPMediaPlayer:
     then register it with BlueZ.
     """
 
+    __slots__ = (
+        "_bus", "_player", "_adapter_path", "_registered", "_exported", "_media_iface",
+    )
+
     def __init__(
         self,
         bus: MessageBus,
@@ -210,61 +326,38 @@ class AVRCPMediaPlayer:
         self._player = MPRISPlayerInterface(command_callback)
         self._adapter_path = adapter_path
         self._registered = False
+        self._exported = False
+        self._media_iface = None  # org.bluez.Media1 proxy from _MEDIA1_NODE
+
+    def _get_media(self):
+        """Return the adapter's org.bluez.Media1 interface (built once)."""
+        if self._media_iface is None:
+            proxy = self._bus.get_proxy_object(
+                BLUEZ_SERVICE, self._adapter_path, _MEDIA1_NODE
+            )
+            self._media_iface = proxy.get_interface(MEDIA_INTERFACE)
+        return self._media_iface
 
     async def register(self) -> None:
         """Export the player interface and register with BlueZ Media1."""
         self._bus.export(PLAYER_PATH, self._player)
+        self._exported = True
 
-        properties = {
-            "PlaybackStatus": Variant("s", "Stopped"),
-            "LoopStatus": Variant("s", "None"),
-            "Rate": Variant("d", 1.0),
-            "Shuffle": Variant("b", False),
-            "Metadata": Variant("a{sv}", {
-                "xesam:title": Variant("s", "Home Assistant Audio"),
-                "xesam:artist": Variant("as", [""]),
-                "mpris:length": Variant("x", 0),
-            }),
-            "Volume": Variant("d", 1.0),
-            "Position": Variant("x", 0),
-            "MinimumRate": Variant("d", 1.0),
-            "MaximumRate": Variant("d", 1.0),
-            "CanGoNext": Variant("b", True),
-            "CanGoPrevious": Variant("b", True),
-            "CanPlay": Variant("b", True),
-            "CanPause": Variant("b", True),
-            "CanSeek": Variant("b", False),
-            "CanControl": Variant("b", True),
-        }
-
-        introspection = await self._bus.introspect(BLUEZ_SERVICE, self._adapter_path)
-        proxy = self._bus.get_proxy_object(
-            BLUEZ_SERVICE, self._adapter_path, introspection
-        )
-        media = proxy.get_interface(MEDIA_INTERFACE)
-
-        await media.call_register_player(PLAYER_PATH, properties)
+        media = self._get_media()
+        await media.call_register_player(PLAYER_PATH, _INITIAL_PLAYER_PROPS)
         self._registered = True
         logger.info(
             "AVRCP media player registered at %s on adapter %s (bus %s)",
             PLAYER_PATH, self._adapter_path, self._bus.unique_name,
         )
 
-        # Verify the player object is exported locally (no D-Bus round-trip;
-        # the system bus default policy blocks method calls to our own unique
-        # name, but BlueZ has elevated permissions and CAN call us).
-        try:
-            from dbus_next.service import ServiceInterface
-            exported = any(
-                isinstance(iface, MPRISPlayerInterface)
-                for iface in self._bus._path_exports.get(PLAYER_PATH, [])
-            )
-            logger.info(
-                "MPRIS player export check: path=%s exported=%s bus=%s",
-                PLAYER_PATH, exported, self._bus.unique_name,
-            )
-        except Exception as e:
-            logger.debug("MPRIS player export check failed: %s", e)
+        # Report the local export (no D-Bus round-trip; the system bus
+        # default policy blocks method calls to our own unique name, but
+        # BlueZ has elevated permissions and CAN call us).
+        logger.info(
+            "MPRIS player export check: path=%s exported=%s bus=%s",
+            PLAYER_PATH, self._exported, self._bus.unique_name,
+        )
 
     def set_playback_status(self, status: str) -> None:
         """Update the MPRIS PlaybackStatus and notify the speaker via AVRCP.
@@ -279,15 +372,12 @@ class AVRCPMediaPlayer:
         if not self._registered:
             return
         try:
-            introspection = await self._bus.introspect(BLUEZ_SERVICE, self._adapter_path)
-            proxy = self._bus.get_proxy_object(
-                BLUEZ_SERVICE, self._adapter_path, introspection
-            )
-            media = proxy.get_interface(MEDIA_INTERFACE)
+            media = self._get_media()
             await media.call_unregister_player(PLAYER_PATH)
         except DBusError as e:
             logger.debug("Player unregister failed (may already be gone): %s", e)
         finally:
             self._bus.unexport(PLAYER_PATH, self._player)
+            self._exported = False
             self._registered = False
         logger.info("AVRCP media player unregistered")
@@ -10,7 +10,7 @@ reinstall) and managed via the app's web UI.
 
 import json
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -20,16 +20,16 @@ SETTINGS_PATH = "/config/settings.json"
 _LEGACY_SETTINGS_PATH = "/data/settings.json"
 
 # Keys that live in settings.json (managed via app UI)
-_SETTINGS_KEYS = {
+_SETTINGS_KEYS = frozenset({
     "bt_adapter",
     "auto_reconnect",
     "reconnect_interval_seconds",
     "reconnect_max_backoff_seconds",
     "scan_duration_seconds",
-}
+})
 
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     """Application configuration loaded from HA app options + settings."""
 
@@ -79,11 +79,13 @@ class AppConfig:
         config = cls()
 
         # 1. Load log_level from options.json (only setting left on HAOS page)
+        # Parsed once here and reused for the legacy-key migration in step 3.
         opts_path = Path(OPTIONS_PATH)
+        options = None
         if opts_path.exists():
             try:
-                data = json.loads(opts_path.read_text())
-                config.log_level = data.get("log_level", "info")
+                options = json.loads(opts_path.read_bytes())
+                config.log_level = options.get("log_level", "info")
             except (json.JSONDecodeError, KeyError) as e:
                 logger.error("Failed to parse options: %s, using defaults", e)
 
@@ -93,17 +95,16 @@ class AppConfig:
         if not settings_path.exists() and legacy_settings.exists():
             logger.info("Migrating settings from %s to %s", legacy_settings, settings_path)
             settings_path.parent.mkdir(parents=True, exist_ok=True)
-            settings_path.write_text(legacy_settings.read_text())
+            settings_path.write_bytes(legacy_settings.read_bytes())
 
         # 2. Load settings from settings.json
         if settings_path.exists():
             try:
-                settings = json.loads(settings_path.read_text())
-                config.bt_adapter = settings.get("bt_adapter", "auto")
-                config.auto_reconnect = settings.get("auto_reconnect", True)
-                config.reconnect_interval_seconds = settings.get("reconnect_interval_seconds", 30)
-                config.reconnect_max_backoff_seconds = settings.get("reconnect_max_backoff_seconds", 300)
-                config.scan_duration_seconds = settings.get("scan_duration_seconds", 30)
+                settings = json.loads(settings_path.read_bytes())
+                # Keys map 1:1 onto fields; absent keys keep the defaults
+                config = replace(
+                    config, **{k: settings[k] for k in settings.keys() & _SETTINGS_KEYS}
+                )
                 logger.info("Loaded settings from %s", SETTINGS_PATH)
                 return config
             except (json.JSONDecodeError, KeyError) as e:
@@ -111,20 +112,13 @@ class AppConfig:
 
         # 3. Migration: settings.json doesn't exist — check options.json
         #    for legacy keys (user upgrading from older version)
-        if opts_path.exists():
-            try:
-                data = json.loads(opts_path.read_text())
-                migrated = False
-                for key in _SETTINGS_KEYS:
-                    if key in data:
-                        setattr(config, key, data[key])
-                        migrated = True
-                if migrated:
-                    config.save_settings()
-                    logger.info("Migrated settings from options.json → settings.json")
-                    return config
-            except (json.JSONDecodeError, KeyError):
-                pass
+        if options:
+            legacy = {k: options[k] for k in options.keys() & _SETTINGS_KEYS}
+            if legacy:
+                config = replace(config, **legacy)
+                config.save_settings()
+                logger.info("Migrated settings from options.json → settings.json")
+                return config
 
         # 4. No settings found — save defaults so the file exists
         config.save_settings()
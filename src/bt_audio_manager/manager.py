@@ -9,6 +9,7 @@ import collections
 import json
 import logging
 import os
+import re
 import time
 
 from dbus_next.aio import MessageBus
@@ -38,6 +39,40 @@ def _dbus_val(variant, default=None):
     return variant.value if hasattr(variant, "value") else variant
 
 
+# Device address inside a BlueZ object path, e.g.
+# /org/bluez/hci0/dev_AA_BB_CC_DD_EE_FF/sep1/fd0
+_DEV_PATH_RE = re.compile(r"/dev_([0-9A-Fa-f]{2}(?:_[0-9A-Fa-f]{2}){5})")
+_UNDERSCORE_TO_COLON = str.maketrans("_", ":")
+
+
+def _addr_from_path(path: str) -> str:
+    """Return the device address in a BlueZ object path, or "" if none."""
+    m = _DEV_PATH_RE.search(path)
+    return m.group(1).translate(_UNDERSCORE_TO_COLON) if m else ""
+
+
+# Device1 properties that fire many times per second per device during
+# discovery and carry nothing actionable for this app (RSSI is cached
+# separately before filtering).
+_NOISY_DEVICE_PROPS = frozenset({"RSSI", "ManufacturerData", "TxPower", "ServiceData"})
+
+# Interfaces whose PropertiesChanged values (not just names) are logged
+_VALUE_IFACES = frozenset({
+    "org.bluez.MediaTransport1",
+    "org.bluez.Device1",
+    "org.bluez.Adapter1",
+})
+
+
+def _sinks_snapshot(sinks: list[dict]) -> tuple:
+    """Return a comparable snapshot of list_bt_sinks() output.
+
+    Every sink dict is built with the same keys in the same order, so
+    comparing value tuples is equivalent to comparing the dicts.
+    """
+    return tuple(tuple(sink.values()) for sink in sinks)
+
+
 def classify_signal(rssi: int | None) -> str | None:
     """Classify RSSI (dBm) into a signal quality label."""
     if rssi is None:
@@ -93,7 +128,7 @@ class BluetoothAudioManager:
         self._auto_disconnect_tasks: dict[str, asyncio.Task] = {}  # addr → auto-disconnect timer
         self._suspended_sinks: set[str] = set()  # addresses with suspended sinks
         self._mpd_instances: dict[str, MPDManager] = {}  # addr → per-device MPD
-        self._last_avrcp_device: tuple[str, float] | None = None  # (addr, timestamp)
+        self._last_avrcp_device: tuple[str, float] | None = None  # (addr, time.monotonic())
         self.media_player: AVRCPMediaPlayer | None = None
         self.managed_devices: dict[str, BluezDevice] = {}
         self._web_server = None
@@ -101,17 +136,18 @@ class BluetoothAudioManager:
         self._sink_poll_task: asyncio.Task | None = None
         self._rssi_poll_task: asyncio.Task | None = None
         self._connected_rssi: dict[str, int | None] = {}  # addr → last RSSI
-        self._rssi_timestamp: dict[str, float] = {}  # addr → time.time() of last RSSI update
-        self._last_rssi_refresh_start: float = 0.0  # time.time() when last refresh burst started
-        self._last_sink_snapshot: str = ""
+        self._rssi_timestamp: dict[str, float] = {}  # addr → time.monotonic() of last RSSI update
+        self._last_rssi_refresh_start: float = 0.0  # time.monotonic() when last refresh burst started
+        self._last_sink_snapshot: tuple | None = None  # see _sinks_snapshot()
+        self._last_sink_count: int = -1  # for sink count transition logging
         self._last_signaled_volume: dict[str, int] = {}  # addr → raw 0-127
         self._last_pa_volume: dict[str, int] = {}  # addr → last PA vol% synced to MPD
-        self._device_connect_time: dict[str, float] = {}  # addr → time.time()
-        self._connecting: set[str] = set()  # addrs with connection in progress
+        self._device_connect_time: dict[str, float] = {}  # addr → time.monotonic()
+        self._connecting: dict[str, asyncio.Event] = {}  # addr → set when connection attempt ends
         self._suppress_reconnect: set[str] = set()  # addresses with user-initiated disconnect
         self._a2dp_attempts: dict[str, int] = {}  # addr → consecutive A2DP activation failures
         self._null_hfp_registered: bool = False  # tracks null HFP handler state
-        self._recent_disconnects: dict[str, float] = {}  # addr → time.time() for burst detection
+        self._recent_disconnects: dict[str, float] = {}  # addr → time.monotonic() for burst detection
         # Ring buffers so WebSocket clients get recent events on reconnect
         self.recent_mpris: collections.deque = collections.deque(maxlen=self.MAX_RECENT_EVENTS)
         self.recent_avrcp: collections.deque = collections.deque(maxlen=self.MAX_RECENT_EVENTS)
@@ -121,6 +157,8 @@ class BluetoothAudioManager:
         self._scanning: bool = False
         self._scan_task: asyncio.Task | None = None
         self._scan_debounce_handle: asyncio.TimerHandle | None = None
+        self._broadcast_handle: asyncio.TimerHandle | None = None  # pending _broadcast_all
+        self._devices_broadcast_handle: asyncio.TimerHandle | None = None  # pending devices-only push
         self._pending_toasts: list[dict] = []  # toasts queued before any WS client connects
 
     async def _resolve_adapter_path(self) -> str:
@@ -191,14 +229,10 @@ class BluetoothAudioManager:
 
         Tie-break: first in *adapters* list (i.e. lowest hci index).
         """
-        from .bluez.constants import (
-            BLUEZ_SERVICE, OBJECT_MANAGER_INTERFACE, DEVICE_INTERFACE, AUDIO_UUIDS,
-        )
+        from .bluez.constants import DEVICE_INTERFACE, AUDIO_UUIDS
         scores: dict[str, int] = {a["path"]: 0 for a in adapters}
         try:
-            intro = await self.bus.introspect(BLUEZ_SERVICE, "/")
-            proxy = self.bus.get_proxy_object(BLUEZ_SERVICE, "/", intro)
-            obj_mgr = proxy.get_interface(OBJECT_MANAGER_INTERFACE)
+            obj_mgr = await BluezAdapter.get_object_manager(self.bus)
             objects = await obj_mgr.call_get_managed_objects()
             for path, ifaces in objects.items():
                 if DEVICE_INTERFACE not in ifaces:
@@ -230,166 +264,25 @@ class BluetoothAudioManager:
         self.bus = await MessageBus(bus_type=BusType.SYSTEM).connect()
         logger.info("Connected to system D-Bus")
 
-        # Capture all D-Bus activity from BlueZ so we can diagnose
-        # which signals/methods arrive for button presses, volume, etc.
-        def _dbus_msg_handler(msg: Message) -> bool:
-            if msg.message_type == MessageType.METHOD_CALL:
-                logger.debug(
-                    "D-Bus method_call: %s.%s path=%s sender=%s",
-                    msg.interface, msg.member, msg.path, msg.sender,
-                )
-            elif (
-                msg.message_type == MessageType.SIGNAL
-                and msg.member == "InterfacesAdded"
-                and msg.path == "/"
-                and self._scanning
-                and msg.body
-                and len(msg.body) >= 2
-            ):
-                # ObjectManager.InterfacesAdded — new device discovered
-                obj_path = msg.body[0]
-                ifaces = msg.body[1]
-                if (
-                    isinstance(obj_path, str)
-                    and obj_path.startswith("/org/bluez/")
-                    and isinstance(ifaces, dict)
-                    and "org.bluez.Device1" in ifaces
-                ):
-                    dev_props = ifaces.get("org.bluez.Device1", {})
-
-                    def _v(key, _p=dev_props):
-                        raw = _p.get(key)
-                        return raw.value if hasattr(raw, "value") else raw
-
-                    dev_name = _v("Name")
-                    dev_uuids = _v("UUIDs")
-                    dev_cod = _v("Class") or 0
-                    dev_addr_type = _v("AddressType")  # "public" or "random"
-                    dev_appearance = _v("Appearance")   # BLE GAP appearance
-
-                    cod_str = (
-                        f"0x{dev_cod:06X}({cod_major_label(dev_cod)})"
-                        if dev_cod else "(none)"
-                    )
-                    extras = []
-                    if dev_addr_type:
-                        extras.append(f"addr_type={dev_addr_type}")
-                    if dev_appearance:
-                        extras.append(f"appearance=0x{dev_appearance:04X}")
-                    extra_str = f" {' '.join(extras)}" if extras else ""
+        # Capture D-Bus activity from BlueZ so we can diagnose which
+        # signals/methods arrive for button presses, volume, etc.
+        self.bus.add_message_handler(self._handle_dbus_message)
 
-                    logger.info(
-                        "New device discovered during scan: %s name=%s "
-                        "UUIDs=%s CoD=%s%s",
-                        obj_path,
-                        dev_name or "unknown",
-                        sorted(dev_uuids) if dev_uuids else "(none)",
-                        cod_str,
-                        extra_str,
-                    )
-                    # Cache RSSI from InterfacesAdded so newly discovered
-                    # devices (especially BR/EDR-only) have signal strength
-                    # before any PropertiesChanged fires.
-                    dev_rssi = _v("RSSI")
-                    if dev_rssi is not None:
-                        self._handle_rssi_update(obj_path, dev_rssi)
-                    self._schedule_scan_broadcast()
-            elif (
-                msg.message_type == MessageType.SIGNAL
-                and msg.path
-                and msg.path.startswith("/org/bluez/")
-            ):
-                if msg.member == "PropertiesChanged" and msg.body:
-                    # body = [interface_name, changed_props, invalidated]
-                    iface_name = msg.body[0] if msg.body else None
-                    changed = msg.body[1] if len(msg.body) > 1 else {}
-                    prop_names = list(changed.keys()) if isinstance(changed, dict) else []
-
-                    # Cache RSSI from any Device1 signal before noise filtering
-                    if iface_name == "org.bluez.Device1" and "RSSI" in changed:
-                        self._handle_rssi_update(msg.path, changed["RSSI"])
-
-                    # Silently discard noisy ManufacturerData / TxPower / ServiceData
-                    # churn — these fire many times per second per device and
-                    # provide no actionable information for this app.
-                    _NOISY_PROPS = {"RSSI", "ManufacturerData", "TxPower", "ServiceData"}
-                    if iface_name == "org.bluez.Device1" and set(prop_names) <= _NOISY_PROPS:
-                        pass
-                    else:
-                        # Log values for key interfaces; just names for the rest.
-                        # Adapter1 changes (UUIDs, Class) are demoted to debug —
-                        # they fire in bursts during profile re-registration and
-                        # aren't actionable.
-                        _VALUE_IFACES = {
-                            "org.bluez.MediaTransport1",
-                            "org.bluez.Device1",
-                            "org.bluez.Adapter1",
-                        }
-                        is_adapter = iface_name == "org.bluez.Adapter1"
-                        log_fn = logger.debug if is_adapter else logger.info
-                        if iface_name in _VALUE_IFACES and isinstance(changed, dict):
-                            props_str = " ".join(
-                                f"{k}={v.value}" for k, v in changed.items()
-                            )
-                            log_fn(
-                                "BlueZ PropertiesChanged: iface=%s %s path=%s",
-                                iface_name, props_str, msg.path,
-                            )
-                        else:
-                            log_fn(
-                                "BlueZ PropertiesChanged: iface=%s props=%s path=%s",
-                                iface_name, prop_names, msg.path,
-                            )
-
-                    # During scanning, broadcast when UUIDs or Name change
-                    # (UUIDs often arrive after InterfacesAdded)
-                    if (
-                        self._scanning
-                        and iface_name == "org.bluez.Device1"
-                        and {"UUIDs", "Name"}.intersection(prop_names)
-                    ):
-                        self._schedule_scan_broadcast()
-
-                    if iface_name == "org.bluez.MediaTransport1":
-                        # Extract device address from transport D-Bus path
-                        parts = msg.path.split("/")
-                        transport_addr = next(
-                            (p[4:].replace("_", ":") for p in parts if p.startswith("dev_")), ""
-                        )
-                        if "Volume" in changed:
-                            vol_raw = changed["Volume"].value  # 0-127 uint16
-                            vol_pct = round(vol_raw / 127 * 100)
-                            logger.info("AVRCP transport volume: %d%% (raw %d)", vol_pct, vol_raw)
-                            self._last_signaled_volume[transport_addr] = vol_raw
-                            entry = {"address": transport_addr, "property": "Volume", "value": f"{vol_pct}%", "ts": time.time()}
-                            self.recent_avrcp.append(entry)
-                            self.event_bus.emit("avrcp_event", entry)
-                            # Sync volume to the device's MPD instance
-                            mpd = self._mpd_instances.get(transport_addr)
-                            if mpd and mpd.is_running:
-                                self._fire_and_forget(mpd.set_volume(vol_pct))
-                        if "State" in changed:
-                            state = changed["State"].value
-                            if self.media_player and state == "active":
-                                if self._is_avrcp_enabled(transport_addr):
-                                    self.media_player.set_playback_status("Playing")
-                                else:
-                                    logger.info(
-                                        "AVRCP disabled for %s — skipping PlaybackStatus=Playing",
-                                        transport_addr,
-                                    )
-                else:
-                    # Log ALL other BlueZ signals (InterfacesAdded, etc.)
-                    logger.info(
-                        "BlueZ signal: %s.%s path=%s",
-                        msg.interface, msg.member, msg.path,
-                    )
-            return False  # don't consume
-        self.bus.add_message_handler(_dbus_msg_handler)
-
-        # Subscribe to ALL BlueZ signals (broad match for diagnosis)
+        # Subscribe only to the BlueZ signals the handler acts on, so
+        # dbus-daemon filters everything else before it reaches us.
         for match_rule in [
-            "type='signal',sender='org.bluez'",
+            "type='signal',sender='org.bluez',"
+            "interface='org.freedesktop.DBus.ObjectManager'",
+            *(
+                "type='signal',sender='org.bluez',"
+                "interface='org.freedesktop.DBus.Properties',"
+                f"member='PropertiesChanged',arg0='{iface}'"
+                for iface in (
+                    "org.bluez.Device1",
+                    "org.bluez.MediaTransport1",
+                    "org.bluez.Adapter1",
+                )
+            ),
         ]:
             await self.bus.call(
                 Message(
@@ -442,6 +335,7 @@ class BluetoothAudioManager:
             self.pulse.on_volume_change(self._on_pa_volume_change)
             self.pulse.on_sink_state_change(self._on_pa_sink_running)
             self.pulse.on_sink_idle(self._on_pa_sink_idle)
+            self.pulse.on_sinks_changed(self._on_pa_sinks_changed)
             await self.pulse.start_event_monitor()
         except Exception as e:
             logger.warning("PulseAudio connection failed (will retry): %s", e)
@@ -458,7 +352,7 @@ class BluetoothAudioManager:
                     logger.info("Device %s already connected at startup", addr)
                     self._last_signaled_volume.pop(addr, None)
                     self._last_pa_volume.pop(addr, None)
-                    self._device_connect_time[addr] = time.time()
+                    self._device_connect_time[addr] = time.monotonic()
                     if HFP_SWITCHING_ENABLED:
                         audio_profile = self._get_audio_profile(addr)
                         if audio_profile == "hfp":
@@ -476,10 +370,8 @@ class BluetoothAudioManager:
         #     leftover from previous discovery sessions and would otherwise show
         #     as "DISCOVERED" in the UI even when the device is powered off.
         try:
-            from .bluez.constants import BLUEZ_SERVICE, OBJECT_MANAGER_INTERFACE, DEVICE_INTERFACE, AUDIO_UUIDS
-            intro = await self.bus.introspect(BLUEZ_SERVICE, "/")
-            proxy = self.bus.get_proxy_object(BLUEZ_SERVICE, "/", intro)
-            obj_mgr = proxy.get_interface(OBJECT_MANAGER_INTERFACE)
+            from .bluez.constants import BLUEZ_SERVICE, DEVICE_INTERFACE, AUDIO_UUIDS
+            obj_mgr = await BluezAdapter.get_object_manager(self.bus)
             objects = await obj_mgr.call_get_managed_objects()
             stored_addrs = {d["address"] for d in self.store.devices}
 
@@ -526,10 +418,8 @@ class BluetoothAudioManager:
         reimported_count = 0
         reimport_adapters: set[str] = set()
         try:
-            from .bluez.constants import BLUEZ_SERVICE, OBJECT_MANAGER_INTERFACE, DEVICE_INTERFACE, AUDIO_UUIDS
-            intro = await self.bus.introspect(BLUEZ_SERVICE, "/")
-            proxy = self.bus.get_proxy_object(BLUEZ_SERVICE, "/", intro)
-            obj_mgr = proxy.get_interface(OBJECT_MANAGER_INTERFACE)
+            from .bluez.constants import DEVICE_INTERFACE, AUDIO_UUIDS
+            obj_mgr = await BluezAdapter.get_object_manager(self.bus)
             objects = await obj_mgr.call_get_managed_objects()
 
             for path, ifaces in objects.items():
@@ -560,7 +450,7 @@ class BluetoothAudioManager:
                     )
                     try:
                         device = await self._get_or_create_device(addr)
-                        self._device_connect_time[addr] = time.time()
+                        self._device_connect_time[addr] = time.monotonic()
                         if self._should_disconnect_hfp(addr):
                             await self._disconnect_hfp(addr)
                     except Exception as e:
@@ -596,10 +486,7 @@ class BluetoothAudioManager:
         #     that were already active before we started).
         if self.media_player:
             try:
-                from .bluez.constants import BLUEZ_SERVICE, OBJECT_MANAGER_INTERFACE
-                intro = await self.bus.introspect(BLUEZ_SERVICE, "/")
-                proxy = self.bus.get_proxy_object(BLUEZ_SERVICE, "/", intro)
-                obj_mgr = proxy.get_interface(OBJECT_MANAGER_INTERFACE)
+                obj_mgr = await BluezAdapter.get_object_manager(self.bus)
                 objects = await obj_mgr.call_get_managed_objects()
                 for path, ifaces in objects.items():
                     if "org.bluez.MediaTransport1" not in ifaces:
@@ -608,11 +495,7 @@ class BluetoothAudioManager:
                     state_v = tp.get("State")
                     state = state_v.value if hasattr(state_v, "value") else state_v
                     if state == "active":
-                        # Extract device address from transport path
-                        parts = path.split("/")
-                        addr = next(
-                            (p[4:].replace("_", ":") for p in parts if p.startswith("dev_")), ""
-                        )
+                        addr = _addr_from_path(path)
                         if self._is_avrcp_enabled(addr):
                             logger.info(
                                 "Active A2DP transport at startup (%s) — setting PlaybackStatus=Playing", path,
@@ -643,12 +526,170 @@ class BluetoothAudioManager:
                 await self._apply_idle_mode(addr)
                 await self._start_mpd_if_enabled(addr)
 
-        # 10. Start periodic sink state polling
+        # 10. Start sink polling fallback (idle while PA events are live) and RSSI refresh
         self._sink_poll_task = asyncio.create_task(self._sink_poll_loop())
         self._rssi_poll_task = asyncio.create_task(self._rssi_refresh_loop())
 
         logger.info("Bluetooth Audio Manager started successfully")
 
+    def _handle_dbus_message(self, msg: Message) -> bool:
+        """Observe BlueZ D-Bus traffic (never consumes messages).
+
+        Logs signals and method calls for diagnosis of button presses,
+        volume, etc., caches RSSI, drives scan broadcasts, and reacts to
+        MediaTransport1 Volume/State changes.
+        """
+        if msg.message_type != MessageType.SIGNAL:
+            # Method returns/errors for our own calls land here too
+            if msg.message_type == MessageType.METHOD_CALL:
+                logger.debug(
+                    "D-Bus method_call: %s.%s path=%s sender=%s",
+                    msg.interface, msg.member, msg.path, msg.sender,
+                )
+            return False
+        if (
+            msg.member == "InterfacesAdded"
+            and msg.path == "/"
+            and self._scanning
+            and msg.body
+            and len(msg.body) >= 2
+        ):
+            # ObjectManager.InterfacesAdded — new device discovered
+            obj_path = msg.body[0]
+            ifaces = msg.body[1]
+            if (
+                isinstance(obj_path, str)
+                and obj_path.startswith("/org/bluez/")
+                and isinstance(ifaces, dict)
+                and "org.bluez.Device1" in ifaces
+            ):
+                dev_props = ifaces.get("org.bluez.Device1", {})
+
+                def _v(key, _p=dev_props):
+                    raw = _p.get(key)
+                    return raw.value if hasattr(raw, "value") else raw
+
+                # Formatting the discovery line is not free; skip it
+                # entirely when INFO is filtered out.
+                if logger.isEnabledFor(logging.INFO):
+                    dev_name = _v("Name")
+                    dev_uuids = _v("UUIDs")
+                    dev_cod = _v("Class") or 0
+                    dev_addr_type = _v("AddressType")  # "public" or "random"
+                    dev_appearance = _v("Appearance")   # BLE GAP appearance
+
+                    cod_str = (
+                        f"0x{dev_cod:06X}({cod_major_label(dev_cod)})"
+                        if dev_cod else "(none)"
+                    )
+                    extras = []
+                    if dev_addr_type:
+                        extras.append(f"addr_type={dev_addr_type}")
+                    if dev_appearance:
+                        extras.append(f"appearance=0x{dev_appearance:04X}")
+                    extra_str = f" {' '.join(extras)}" if extras else ""
+
+                    logger.info(
+                        "New device discovered during scan: %s name=%s "
+                        "UUIDs=%s CoD=%s%s",
+                        obj_path,
+                        dev_name or "unknown",
+                        sorted(dev_uuids) if dev_uuids else "(none)",
+                        cod_str,
+                        extra_str,
+                    )
+                # Cache RSSI from InterfacesAdded so newly discovered
+                # devices (especially BR/EDR-only) have signal strength
+                # before any PropertiesChanged fires.
+                dev_rssi = _v("RSSI")
+                if dev_rssi is not None:
+                    self._handle_rssi_update(obj_path, dev_rssi)
+                self._schedule_scan_broadcast()
+        elif msg.path and msg.path.startswith("/org/bluez/"):
+            if msg.member == "PropertiesChanged" and msg.body:
+                # body = [interface_name, changed_props, invalidated]
+                iface_name = msg.body[0] if msg.body else None
+                changed = msg.body[1] if len(msg.body) > 1 else {}
+                if not isinstance(changed, dict):
+                    changed = {}
+
+                # Cache RSSI from any Device1 signal before noise filtering
+                if iface_name == "org.bluez.Device1" and "RSSI" in changed:
+                    self._handle_rssi_update(msg.path, changed["RSSI"])
+
+                # Adapter1 changes (UUIDs, Class) are demoted to debug —
+                # they fire in bursts during profile re-registration and
+                # aren't actionable.
+                log_level = (
+                    logging.DEBUG if iface_name == "org.bluez.Adapter1" else logging.INFO
+                )
+                # Silently discard noisy ManufacturerData / TxPower / ServiceData
+                # churn (see _NOISY_DEVICE_PROPS), and skip building the
+                # log line at all when its level is filtered out.
+                if (
+                    iface_name == "org.bluez.Device1"
+                    and changed.keys() <= _NOISY_DEVICE_PROPS
+                ) or not logger.isEnabledFor(log_level):
+                    pass
+                else:
+                    # Log values for key interfaces; just names for the rest.
+                    if iface_name in _VALUE_IFACES:
+                        props_str = " ".join(
+                            f"{k}={v.value}" for k, v in changed.items()
+                        )
+                        logger.log(
+                            log_level,
+                            "BlueZ PropertiesChanged: iface=%s %s path=%s",
+                            iface_name, props_str, msg.path,
+                        )
+                    else:
+                        logger.log(
+                            log_level,
+                            "BlueZ PropertiesChanged: iface=%s props=%s path=%s",
+                            iface_name, list(changed), msg.path,
+                        )
+
+                # During scanning, broadcast when UUIDs or Name change
+                # (UUIDs often arrive after InterfacesAdded)
+                if (
+                    self._scanning
+                    and iface_name == "org.bluez.Device1"
+                    and ("UUIDs" in changed or "Name" in changed)
+                ):
+                    self._schedule_scan_broadcast()
+
+                if iface_name == "org.bluez.MediaTransport1":
+                    transport_addr = _addr_from_path(msg.path)
+                    if "Volume" in changed:
+                        vol_raw = changed["Volume"].value  # 0-127 uint16
+                        vol_pct = round(vol_raw / 127 * 100)
+                        logger.info("AVRCP transport volume: %d%% (raw %d)", vol_pct, vol_raw)
+                        self._last_signaled_volume[transport_addr] = vol_raw
+                        entry = {"address": transport_addr, "property": "Volume", "value": f"{vol_pct}%", "ts": time.time()}
+                        self.recent_avrcp.append(entry)
+                        self.event_bus.emit("avrcp_event", entry)
+                        # Sync volume to the device's MPD instance
+                        mpd = self._mpd_instances.get(transport_addr)
+                        if mpd and mpd.is_running:
+                            self._fire_and_forget(mpd.set_volume(vol_pct))
+                    if "State" in changed:
+                        state = changed["State"].value
+                        if self.media_player and state == "active":
+                            if self._is_avrcp_enabled(transport_addr):
+                                self.media_player.set_playback_status("Playing")
+                            else:
+                                logger.info(
+                                    "AVRCP disabled for %s — skipping PlaybackStatus=Playing",
+                                    transport_addr,
+                                )
+            else:
+                # Log ALL other BlueZ signals (InterfacesAdded, etc.)
+                logger.info(
+                    "BlueZ signal: %s.%s path=%s",
+                    msg.interface, msg.member, msg.path,
+                )
+        return False  # don't consume
+
     async def shutdown(self) -> None:
         """Graceful teardown in reverse order."""
         logger.info("Shutting down Bluetooth Audio Manager...")
@@ -662,6 +703,13 @@ class BluetoothAudioManager:
                 except asyncio.CancelledError:
                     pass
 
+        # Drop any pending debounced broadcasts
+        for handle in (self._broadcast_handle, self._devices_broadcast_handle):
+            if handle and not handle.cancelled():
+                handle.cancel()
+        self._broadcast_handle = None
+        self._devices_broadcast_handle = None
+
         # Cancel any running scan
         if self._scan_task and not self._scan_task.done():
             self._scan_task.cancel()
@@ -697,6 +745,7 @@ class BluetoothAudioManager:
         # Stop any active discovery
         if self.adapter:
             await self.adapter.stop_discovery()
+            self.adapter.cleanup()
 
         # Disconnect PulseAudio
         if self.pulse:
@@ -725,6 +774,12 @@ class BluetoothAudioManager:
 
     # -- Device lifecycle operations --
 
+    def _end_connecting(self, address: str) -> None:
+        """Mark a connection attempt finished and wake anyone waiting on it."""
+        event = self._connecting.pop(address, None)
+        if event is not None:
+            event.set()
+
     def _device_lock(self, address: str) -> asyncio.Lock:
         """Get or create a per-device lifecycle lock."""
         lock = self._device_lifecycle_locks.get(address)
@@ -739,21 +794,8 @@ class BluetoothAudioManager:
         Returns the adapter D-Bus path (e.g. '/org/bluez/hci0') or None.
         Prefers the configured adapter if the device exists on multiple adapters.
         """
-        from .bluez.constants import BLUEZ_SERVICE, OBJECT_MANAGER_INTERFACE
-
-        dev_suffix = f"/dev_{address.replace(':', '_')}"
         try:
-            intro = await self.bus.introspect(BLUEZ_SERVICE, "/")
-            proxy = self.bus.get_proxy_object(BLUEZ_SERVICE, "/", intro)
-            obj_mgr = proxy.get_interface(OBJECT_MANAGER_INTERFACE)
-            objects = await obj_mgr.call_get_managed_objects()
-
-            found_adapters = []
-            for path in objects:
-                if path.endswith(dev_suffix):
-                    adapter_path = path[: path.rfind("/")]
-                    found_adapters.append(adapter_path)
-
+            found_adapters = await BluezAdapter.find_device_adapters(self.bus, address)
             if not found_adapters:
                 return None
             # Prefer the configured adapter if device exists there
@@ -812,7 +854,7 @@ class BluetoothAudioManager:
             await self.adapter.stop_discovery()
 
         self._scanning = True
-        self._last_rssi_refresh_start = time.time()
+        self._last_rssi_refresh_start = time.monotonic()
         self.event_bus.emit("scan_started", {"duration": duration})
         self._scan_task = asyncio.create_task(self._run_scan(duration))
 
@@ -879,24 +921,25 @@ class BluetoothAudioManager:
         self._a2dp_attempts.pop(address, None)  # fresh pair — reset retry counter
         # Mark as connecting early so the Connected signal fired during pair()
         # doesn't race with connect_device() and double-fire HFP disconnect.
-        self._connecting.add(address)
+        self._connecting.setdefault(address, asyncio.Event())
         try:
             device = await self._get_or_create_device(address)
 
             # Pair
             await device.pair()
 
-            # Trust (enables BlueZ-level auto-reconnect)
-            await device.set_trusted(True)
-
-            # Get name for display
-            name = await device.get_name()
+            # Trust (enables BlueZ-level auto-reconnect) and read the
+            # display name together — neither depends on the other, only
+            # on pair() having completed.
+            _, name = await asyncio.gather(
+                device.set_trusted(True), device.get_name(),
+            )
 
             # Persist
             await self.store.add_device(address, name)
 
             logger.info("Device %s (%s) paired and stored", address, name)
-            await self._broadcast_all()
+            self._schedule_broadcast_all()
 
             # Follow through with full connect + A2DP sink wait
             # _connecting is already set; pass _from_pair so connect_device
@@ -918,7 +961,7 @@ class BluetoothAudioManager:
 
             return result
         except Exception:
-            self._connecting.discard(address)
+            self._end_connecting(address)
             self.event_bus.emit("status", {"message": ""})
             raise
 
@@ -934,18 +977,18 @@ class BluetoothAudioManager:
         if not _from_pair and address in self._connecting:
             logger.info("Connection already in progress for %s, waiting...", address)
             self._broadcast_status(f"Waiting for connection to {address}...")
-            for _ in range(60):
-                await asyncio.sleep(0.5)
-                if address not in self._connecting:
-                    break
+            try:
+                await asyncio.wait_for(self._connecting[address].wait(), timeout=30)
+            except asyncio.TimeoutError:
+                pass
             device = self.managed_devices.get(address)
             if device and await device.is_connected():
                 if self.pulse:
                     sink = await self.pulse.get_sink_for_address(address)
                     if sink:
-                        await self._broadcast_all()
+                        self._schedule_broadcast_all()
                         return True
-            await self._broadcast_all()
+            self._schedule_broadcast_all()
             return False
 
         # Cancel any pending auto-reconnect to avoid racing.
@@ -958,7 +1001,7 @@ class BluetoothAudioManager:
         self._suppress_reconnect.discard(address)
         self._broadcast_status(f"Connecting to {address}...")
 
-        self._connecting.add(address)
+        self._connecting.setdefault(address, asyncio.Event())
         try:
             device = await self._get_or_create_device(address)
 
@@ -1092,17 +1135,17 @@ class BluetoothAudioManager:
                             await self._disconnect_hfp(address)
                         await self._apply_idle_mode(address)
                         await self._start_mpd_if_enabled(address)
-                    await self._broadcast_all()
+                    self._schedule_broadcast_all()
                     return True
                 logger.warning("%s sink for %s did not appear in PulseAudio", profile_label, address)
-                await self._broadcast_all()
+                self._schedule_broadcast_all()
                 return False
 
             # PulseAudio not available — connection may still work at BlueZ level
-            await self._broadcast_all()
+            self._schedule_broadcast_all()
             return await device.is_connected()
         finally:
-            self._connecting.discard(address)
+            self._end_connecting(address)
             self.event_bus.emit("status", {"message": ""})
 
     async def disconnect_device(self, address: str) -> None:
@@ -1121,7 +1164,7 @@ class BluetoothAudioManager:
         except Exception as e:
             logger.warning("Disconnect failed for %s: %s", address, e)
         self.event_bus.emit("status", {"message": ""})
-        await self._broadcast_all()
+        self._schedule_broadcast_all()
 
     async def force_reconnect_device(self, address: str) -> bool:
         """Force disconnect + reconnect cycle (recovery for zombie connections)."""
@@ -1149,7 +1192,7 @@ class BluetoothAudioManager:
         self._last_signaled_volume.pop(address, None)
         self._last_pa_volume.pop(address, None)
         self._device_lifecycle_locks.pop(address, None)
-        self._connecting.discard(address)
+        self._end_connecting(address)
         self._suppress_reconnect.discard(address)
         # Cancel reconnection
         if self.reconnect_service:
@@ -1186,7 +1229,7 @@ class BluetoothAudioManager:
         await self.store.remove_device(address)
         logger.info("Device %s forgotten", address)
         self.event_bus.emit("status", {"message": ""})
-        await self._broadcast_all()
+        self._schedule_broadcast_all()
 
     async def clear_all_devices(self) -> None:
         """Disconnect, unpair, and remove ALL devices from BlueZ and the
@@ -1252,11 +1295,13 @@ class BluetoothAudioManager:
         self._last_pa_volume.clear()
         self._suppress_reconnect.clear()
         self._a2dp_attempts.clear()
+        for event in self._connecting.values():
+            event.set()
         self._connecting.clear()
 
         self._broadcast_status(f"Cleared {total} device(s)")
         logger.info("clear_all_devices: removed %d device(s)", total)
-        await self._broadcast_all()
+        self._schedule_broadcast_all()
 
     async def get_all_devices(self, *, cod_fallback: bool = False) -> list[dict]:
         """Get combined list of discovered and paired devices."""
@@ -1265,14 +1310,16 @@ class BluetoothAudioManager:
         # Get currently visible devices from BlueZ
         discovered = await self.adapter.get_audio_devices(cod_fallback=cod_fallback)
 
-        # Merge with persistent store info
-        stored_addresses = {d["address"] for d in self.store.devices}
+        # Merge with persistent store info (one pass over each list)
+        stored_by_addr = {d["address"]: d for d in self.store.devices}
+        discovered_addresses: set[str] = set()
         for device in discovered:
             addr = device["address"]
-            device["stored"] = addr in stored_addresses
-            if device["stored"]:
-                stored_entry = self.store.get_device(addr)
-                if stored_entry and stored_entry.get("name"):
+            discovered_addresses.add(addr)
+            stored_entry = stored_by_addr.get(addr)
+            device["stored"] = stored_entry is not None
+            if stored_entry is not None:
+                if stored_entry.get("name"):
                     device["name"] = stored_entry["name"]
                 s = self.store.get_device_settings(addr)
                 device["idle_mode"] = s.get("idle_mode", "default")
@@ -1286,9 +1333,7 @@ class BluetoothAudioManager:
                 device["avrcp_enabled"] = s.get("avrcp_enabled", True)
 
         # Add stored devices not currently visible
-        discovered_addresses = {d["address"] for d in discovered}
-        for stored in self.store.devices:
-            addr = stored["address"]
+        for addr, stored in stored_by_addr.items():
             if addr not in discovered_addresses:
                 s = self.store.get_device_settings(addr)
                 discovered.append(
@@ -1597,35 +1642,48 @@ class BluetoothAudioManager:
     # -- Sink state polling --
 
     async def _sink_poll_loop(self) -> None:
-        """Periodically check PulseAudio sink state and broadcast changes.
+        """Fallback sink polling for when PulseAudio events are unavailable.
 
-        Detects idle→running transitions (playback started/stopped) that
-        don't trigger D-Bus signals.
+        Sink changes are normally pushed by the PA event subscription
+        (see _on_pa_sinks_changed); this only polls while it is down.
         """
-        prev_sink_count = -1  # force first log
         while True:
             try:
                 await asyncio.sleep(self.SINK_POLL_INTERVAL)
-                if not self.pulse:
+                if not self.pulse or self.pulse.events_live:
                     continue
-                sinks = await self.pulse.list_bt_sinks()
-                # Log sink count transitions
-                if len(sinks) != prev_sink_count:
-                    names = [s["name"] for s in sinks] if sinks else []
-                    logger.info(
-                        "BT sinks: %d (was %d) %s",
-                        len(sinks), max(prev_sink_count, 0), names,
-                    )
-                    prev_sink_count = len(sinks)
-                snapshot = json.dumps(sinks, sort_keys=True)
-                if snapshot != self._last_sink_snapshot:
-                    self._last_sink_snapshot = snapshot
-                    self.event_bus.emit("sinks_changed", {"sinks": sinks})
+                await self._refresh_sinks()
             except asyncio.CancelledError:
                 return
             except Exception as e:
                 logger.debug("Sink poll error: %s", e)
 
+    def _on_pa_sinks_changed(self) -> None:
+        """Handle a (debounced) batch of PulseAudio sink events."""
+        self._fire_and_forget(self._refresh_sinks())
+
+    async def _refresh_sinks(self) -> None:
+        """Re-read BT sinks and broadcast them if anything changed.
+
+        Detects idle→running transitions (playback started/stopped) that
+        don't trigger D-Bus signals.
+        """
+        if not self.pulse:
+            return
+        sinks = await self.pulse.list_bt_sinks()
+        # Log sink count transitions
+        if len(sinks) != self._last_sink_count:
+            names = [s["name"] for s in sinks] if sinks else []
+            logger.info(
+                "BT sinks: %d (was %d) %s",
+                len(sinks), max(self._last_sink_count, 0), names,
+            )
+            self._last_sink_count = len(sinks)
+        snapshot = _sinks_snapshot(sinks)
+        if snapshot != self._last_sink_snapshot:
+            self._last_sink_snapshot = snapshot
+            self.event_bus.emit("sinks_changed", {"sinks": sinks})
+
     # -- RSSI tracking (D-Bus discovery events + silent refresh bursts) --
 
     def _handle_rssi_update(self, dbus_path: str, rssi_variant) -> None:
@@ -1655,10 +1713,15 @@ class BluetoothAudioManager:
                 return
         prev = self._connected_rssi.get(address)
         self._connected_rssi[address] = rssi
-        self._rssi_timestamp[address] = time.time()
-        # Broadcast only on significant change (>=3 dBm) or None→value transition
+        self._rssi_timestamp[address] = time.monotonic()
+        # Broadcast only on significant change (>=3 dBm) or None→value transition.
+        # Both paths are debounced and device-only, so an RSSI burst yields
+        # one devices push and no sink query.
         if prev is None or abs(rssi - prev) >= 3:
-            asyncio.ensure_future(self._broadcast_devices(cod_fallback=self._scanning))
+            if self._scanning:
+                self._schedule_scan_broadcast()
+            else:
+                self._schedule_broadcast_devices()
 
     async def _rssi_refresh_loop(self) -> None:
         """Periodically run silent discovery bursts to refresh RSSI.
@@ -1685,7 +1748,7 @@ class BluetoothAudioManager:
                     self._rssi_cleanup()
                     continue
 
-                self._last_rssi_refresh_start = time.time()
+                self._last_rssi_refresh_start = time.monotonic()
                 try:
                     await self.adapter.start_rssi_refresh()
                     await asyncio.sleep(self.RSSI_REFRESH_DURATION)
@@ -1707,17 +1770,15 @@ class BluetoothAudioManager:
 
     def _rssi_cleanup(self) -> None:
         """Remove stale RSSI entries for devices no longer visible."""
-        changed = False
-        for addr in list(self._connected_rssi):
-            if addr in self.managed_devices:
-                continue
-            if addr in self._device_connect_time:
-                continue
+        stale = [
+            addr for addr in self._connected_rssi
+            if addr not in self.managed_devices and addr not in self._device_connect_time
+        ]
+        for addr in stale:
             del self._connected_rssi[addr]
             self._rssi_timestamp.pop(addr, None)
-            changed = True
-        if changed:
-            asyncio.ensure_future(self._broadcast_devices())
+        if stale:
+            self._schedule_broadcast_devices()
 
     # -- SSE broadcast helpers --
 
@@ -1733,7 +1794,7 @@ class BluetoothAudioManager:
         """Push full sink list to all SSE clients."""
         try:
             sinks = await self.get_audio_sinks()
-            self._last_sink_snapshot = json.dumps(sinks, sort_keys=True)
+            self._last_sink_snapshot = _sinks_snapshot(sinks)
             self.event_bus.emit("sinks_changed", {"sinks": sinks})
         except Exception as e:
             logger.debug("Broadcast sinks failed: %s", e)
@@ -1743,6 +1804,49 @@ class BluetoothAudioManager:
         await self._broadcast_devices()
         await self._broadcast_sinks()
 
+    BROADCAST_DEBOUNCE_SECONDS = 0.05  # coalesce back-to-back state pushes
+
+    def _schedule_broadcast_all(self) -> None:
+        """Schedule a debounced _broadcast_all().
+
+        A user action and the D-Bus signals it triggers (e.g. disconnect
+        plus Connected=false) each request a broadcast within a few ms;
+        they share one device/sink query and one push to clients.
+        """
+        if self._broadcast_handle and not self._broadcast_handle.cancelled():
+            return  # already scheduled
+        loop = asyncio.get_running_loop()
+        self._broadcast_handle = loop.call_later(
+            self.BROADCAST_DEBOUNCE_SECONDS,
+            lambda: self._fire_and_forget(self._debounced_broadcast_all()),
+        )
+
+    async def _debounced_broadcast_all(self) -> None:
+        """Execute the debounced broadcast."""
+        self._broadcast_handle = None
+        await self._broadcast_all()
+
+    def _schedule_broadcast_devices(self) -> None:
+        """Schedule a debounced _broadcast_devices() without a sink query.
+
+        For device-only changes such as RSSI updates. A no-op while a
+        full broadcast is pending, since that pushes devices too.
+        """
+        if self._broadcast_handle and not self._broadcast_handle.cancelled():
+            return
+        if self._devices_broadcast_handle and not self._devices_broadcast_handle.cancelled():
+            return  # already scheduled
+        loop = asyncio.get_running_loop()
+        self._devices_broadcast_handle = loop.call_later(
+            self.BROADCAST_DEBOUNCE_SECONDS,
+            lambda: self._fire_and_forget(self._debounced_broadcast_devices()),
+        )
+
+    async def _debounced_broadcast_devices(self) -> None:
+        """Execute the debounced devices-only broadcast."""
+        self._devices_broadcast_handle = None
+        await self._broadcast_devices()
+
     def _broadcast_status(self, message: str) -> None:
         """Push a status message to WebSocket clients."""
         self.event_bus.emit("status", {"message": message})
@@ -1760,7 +1864,7 @@ class BluetoothAudioManager:
         self._fire_and_forget(self._on_device_disconnected_async(address))
 
         # Detect adapter-level disruptions: multiple devices dropping at once
-        now = time.time()
+        now = time.monotonic()
         self._recent_disconnects[address] = now
         # Prune stale entries (> 5s old)
         self._recent_disconnects = {
@@ -1786,7 +1890,7 @@ class BluetoothAudioManager:
             logger.info("Skipping auto-reconnect for %s (user-initiated disconnect)", address)
         elif self.reconnect_service:
             self.reconnect_service.handle_disconnect(address)
-        self._fire_and_forget(self._broadcast_all())
+        self._schedule_broadcast_all()
 
     async def _on_device_disconnected_async(self, address: str) -> None:
         """Async handler for device disconnect — stops MPD and idle handlers.
@@ -1800,7 +1904,7 @@ class BluetoothAudioManager:
 
     def _on_device_connected(self, address: str) -> None:
         """Handle device connection event (D-Bus signal)."""
-        self._device_connect_time[address] = time.time()
+        self._device_connect_time[address] = time.monotonic()
         self._last_signaled_volume.pop(address, None)
         self._last_pa_volume.pop(address, None)
         self._fire_and_forget(self._on_device_connected_async(address))
@@ -1812,7 +1916,7 @@ class BluetoothAudioManager:
         disconnect handler (e.g. rapid disconnect/reconnect from signal drop).
         """
         try:
-            await self._broadcast_all()
+            self._schedule_broadcast_all()
 
             # If a connect or HFP reconnect cycle is in progress, don't interfere
             if address in self._connecting:
@@ -1867,16 +1971,12 @@ class BluetoothAudioManager:
 
         Returns True if a MediaTransport1 was found.
         """
-        from .bluez.constants import BLUEZ_SERVICE, OBJECT_MANAGER_INTERFACE
-
         dev_fragment = address.replace(":", "_").upper()
         for attempt in range(3):
             if attempt > 0:
                 await asyncio.sleep(2)
             try:
-                intro = await self.bus.introspect(BLUEZ_SERVICE, "/")
-                proxy = self.bus.get_proxy_object(BLUEZ_SERVICE, "/", intro)
-                obj_mgr = proxy.get_interface(OBJECT_MANAGER_INTERFACE)
+                obj_mgr = await BluezAdapter.get_object_manager(self.bus)
                 objects = await obj_mgr.call_get_managed_objects()
 
                 for path, ifaces in objects.items():
@@ -2064,7 +2164,7 @@ class BluetoothAudioManager:
             return
 
         # Guard against _on_device_connected_async and reconnect service racing
-        self._connecting.add(address)
+        self._connecting.setdefault(address, asyncio.Event())
         self._suppress_reconnect.add(address)
         try:
             # 1. Disconnect HFP
@@ -2129,7 +2229,7 @@ class BluetoothAudioManager:
         except Exception as e:
             logger.warning("HFP cycle: unexpected error for %s: %s", address, e)
         finally:
-            self._connecting.discard(address)
+            self._end_connecting(address)
             self._suppress_reconnect.discard(address)
 
         logger.info("HFP reconnect cycle for %s — done", address)
@@ -2229,53 +2329,15 @@ class BluetoothAudioManager:
         way is to unload/reload the module so PA re-registers with BlueZ.
 
         Strategy:
-        1. Try ``pactl unload-module`` + ``pactl load-module`` (fast, minimal disruption).
+        1. Unload + load the module over our existing PA connection
+           (fast, minimal disruption).
         2. If the load fails (common: "lock: Permission denied" from the
            external PA server), restart the entire HA audio service via the
            Supervisor API and reconnect our PA client.
         """
-        # --- Attempt 1: pactl unload + load ---
-        try:
-            proc = await asyncio.create_subprocess_exec(
-                "pactl", "list", "modules", "short",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            stdout, _ = await proc.communicate()
-            module_index = None
-            for line in stdout.decode().splitlines():
-                if "module-bluez5-discover" in line:
-                    module_index = line.split()[0]
-                    break
-
-            if module_index:
-                proc = await asyncio.create_subprocess_exec(
-                    "pactl", "unload-module", module_index,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                )
-                await proc.communicate()
-                logger.info("Unloaded module-bluez5-discover (index %s)", module_index)
-                await asyncio.sleep(2)
-
-                proc = await asyncio.create_subprocess_exec(
-                    "pactl", "load-module", "module-bluez5-discover",
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                )
-                _, stderr = await proc.communicate()
-                if proc.returncode == 0:
-                    logger.info("Reloaded module-bluez5-discover — PA HFP/HSP handler restored")
-                    await asyncio.sleep(2)
-                    return
-                logger.warning(
-                    "pactl load-module failed: %s — falling back to audio service restart",
-                    stderr.decode(errors="replace").strip(),
-                )
-        except (FileNotFoundError, OSError) as exc:
-            logger.warning("pactl not available: %s — falling back to audio service restart", exc)
-        except Exception as e:
-            logger.warning("pactl module reload failed: %s — falling back to audio service restart", e)
+        # --- Attempt 1: native unload + load ---
+        if self.pulse and await self.pulse.reload_bluez_discover():
+            return
 
         # --- Attempt 2: restart the HA audio service via Supervisor API ---
         await self._restart_audio_service()
@@ -2283,7 +2345,7 @@ class BluetoothAudioManager:
     async def _restart_audio_service(self) -> None:
         """Restart the HA audio service via the Supervisor API.
 
-        This is the nuclear option when ``pactl load-module`` fails.
+        This is the nuclear option when reloading module-bluez5-discover fails.
         It restarts PulseAudio entirely, which re-registers all Bluetooth
         handlers fresh.  Our PA client reconnects automatically afterward.
         """
@@ -2523,13 +2585,9 @@ class BluetoothAudioManager:
 
     async def _log_media_control_player(self, address: str) -> None:
         """Log whether BlueZ linked our MPRIS player to the device's AVRCP session."""
-        from .bluez.constants import BLUEZ_SERVICE, OBJECT_MANAGER_INTERFACE
-
         dev_fragment = address.replace(":", "_").upper()
         try:
-            intro = await self.bus.introspect(BLUEZ_SERVICE, "/")
-            proxy = self.bus.get_proxy_object(BLUEZ_SERVICE, "/", intro)
-            obj_mgr = proxy.get_interface(OBJECT_MANAGER_INTERFACE)
+            obj_mgr = await BluezAdapter.get_object_manager(self.bus)
             objects = await obj_mgr.call_get_managed_objects()
 
             for path, ifaces in objects.items():
@@ -2619,7 +2677,7 @@ class BluetoothAudioManager:
             address,
         )
         # Mark as connecting so the Connected signal handler won't re-enter
-        self._connecting.add(address)
+        self._connecting.setdefault(address, asyncio.Event())
         try:
             await device.disconnect()
             await asyncio.sleep(2)
@@ -2637,7 +2695,7 @@ class BluetoothAudioManager:
             logger.warning("Disconnect/reconnect cycle failed for %s: %s", address, e)
             return False
         finally:
-            self._connecting.discard(address)
+            self._end_connecting(address)
 
     def _on_pa_volume_change(self, sink_name: str, volume: int, mute: bool) -> None:
         """Handle PulseAudio Bluetooth sink volume change (AVRCP Absolute Volume)."""
@@ -2756,7 +2814,7 @@ class BluetoothAudioManager:
         target_addr = None
         if self._last_avrcp_device:
             addr, ts = self._last_avrcp_device
-            if time.time() - ts < self.AVRCP_DEVICE_WINDOW:
+            if time.monotonic() - ts < self.AVRCP_DEVICE_WINDOW:
                 target_addr = addr
 
         if target_addr:
@@ -2795,7 +2853,7 @@ class BluetoothAudioManager:
         """Handle AVRCP MediaPlayer1 property change — push to WebSocket."""
         # Track last active device for AVRCP command routing
         if prop_name == "Status":
-            self._last_avrcp_device = (address, time.time())
+            self._last_avrcp_device = (address, time.monotonic())
 
         # Convert value to JSON-safe representation
         if isinstance(value, dict):
@@ -2851,7 +2909,7 @@ class BluetoothAudioManager:
             logger.debug("Cannot start keep-alive for %s: no PA sink yet", address)
             return
 
-        ka = KeepAliveService(method=settings["keep_alive_method"])
+        ka = KeepAliveService(method=settings["keep_alive_method"], pulse=self.pulse)
         ka.set_target_sink(sink_name)
         await ka.start()
         self._keepalives[address] = ka
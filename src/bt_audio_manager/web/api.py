@@ -66,13 +66,10 @@ def _get_validated_address(body: dict) -> tuple[str | None, web.Response | None]
 async def _ws_sender(
     ws: WebSocketResponse, queue: asyncio.Queue,
 ) -> None:
-    """Forward EventBus events to a WebSocket client."""
+    """Forward EventBus frames (pre-encoded JSON) to a WebSocket client."""
     try:
         while not ws.closed:
-            msg = await queue.get()
-            event = msg["event"]
-            data = msg["data"]
-            await ws.send_json({"type": event, **data})
+            await ws.send_str(await queue.get())
     except (ConnectionResetError, ConnectionError, asyncio.CancelledError):
         pass
 
@@ -1,19 +1,24 @@
 """Event bus for real-time UI updates via WebSocket."""
 
 import asyncio
+import json
 import logging
 
 logger = logging.getLogger(__name__)
 
 
 class EventBus:
-    """Simple pub/sub using asyncio.Queue per connected WebSocket client."""
+    """Simple pub/sub using asyncio.Queue per connected WebSocket client.
+
+    Events are JSON-encoded once in emit(); every client queue receives
+    the same ready-to-send text frame.
+    """
 
     def __init__(self):
         self._clients: set[asyncio.Queue] = set()
 
     def subscribe(self) -> asyncio.Queue:
-        """Add a new client. Returns a queue to read events from."""
+        """Add a new client. Returns a queue of JSON text frames to send."""
         q: asyncio.Queue = asyncio.Queue(maxsize=64)
         self._clients.add(q)
         logger.info("EventBus client subscribed (%d total)", len(self._clients))
@@ -29,9 +34,14 @@ class EventBus:
         if not self._clients:
             return
         logger.debug("EventBus emit: %s → %d client(s)", event, len(self._clients))
+        try:
+            frame = json.dumps({"type": event, **data})
+        except (TypeError, ValueError) as e:
+            logger.warning("Dropping event '%s': not JSON-serializable: %s", event, e)
+            return
         for q in list(self._clients):
             try:
-                q.put_nowait({"event": event, "data": data})
+                q.put_nowait(frame)
             except asyncio.QueueFull:
                 logger.warning("Dropping event '%s' for slow client (queue full)", event)
 
@@ -0,0 +1,67 @@
+"""Tests for BluezAdapter's signal-maintained managed-object mirror."""
+
+import pathlib
+import sys
+import unittest
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent / "src"))
+
+try:
+    from dbus_next import Message, MessageType, Variant
+except ImportError:  # dbus-next is only installed in the app image
+    Message = None
+
+if Message is not None:
+    from bt_audio_manager.bluez.adapter import _MATCH_RULES, BluezAdapter
+
+BLUEZ_OWNER = ":1.7"
+DEV_PATH = "/org/bluez/hci0/dev_AA_BB_CC_DD_EE_FF"
+BREDR = "org.bluez.Bearer.BREDR1"
+LE = "org.bluez.Bearer.LE1"
+
+
+@unittest.skipIf(Message is None, "dbus-next not installed")
+class BearerMirrorTest(unittest.TestCase):
+    def setUp(self):
+        self.adapter = BluezAdapter(bus=None)
+        self.adapter._bluez_owner = BLUEZ_OWNER
+        self.adapter._objects = {
+            DEV_PATH: {
+                BREDR: {"Connected": Variant("b", False)},
+                LE: {"Connected": Variant("b", False)},
+            },
+        }
+
+    def _properties_changed(self, iface, changed, invalidated=()):
+        return Message(
+            message_type=MessageType.SIGNAL,
+            sender=BLUEZ_OWNER,
+            path=DEV_PATH,
+            interface="org.freedesktop.DBus.Properties",
+            member="PropertiesChanged",
+            signature="sa{sv}as",
+            body=[iface, changed, list(invalidated)],
+        )
+
+    def test_bearer_interfaces_are_subscribed(self):
+        for iface in (BREDR, LE):
+            self.assertTrue(
+                any(f"member='PropertiesChanged',arg0='{iface}'" in r for r in _MATCH_RULES),
+                iface,
+            )
+
+    def test_bearer_properties_changed_updates_mirror(self):
+        self.adapter._on_bus_message(
+            self._properties_changed(BREDR, {"Connected": Variant("b", True)})
+        )
+        bearers = self.adapter._objects[DEV_PATH]
+        self.assertTrue(bearers[BREDR]["Connected"].value)
+        self.assertFalse(bearers[LE]["Connected"].value)
+
+    def test_bearer_invalidated_property_is_dropped(self):
+        self.adapter._on_bus_message(self._properties_changed(LE, {}, ["Connected"]))
+        self.assertNotIn("Connected", self.adapter._objects[DEV_PATH][LE])
+
+
+if __name__ == "__main__":
+    unittest.main()
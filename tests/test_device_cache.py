@@ -0,0 +1,91 @@
+"""Tests for BluezDevice's Device1 property cache."""
+
+import asyncio
+import pathlib
+import sys
+import unittest
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent / "src"))
+
+try:
+    from dbus_next import Variant
+except ImportError:  # dbus-next is only installed in the app image
+    Variant = None
+
+if Variant is not None:
+    from bt_audio_manager.bluez import device as device_mod
+
+ADDRESS = "AA:BB:CC:DD:EE:FF"
+DEVICE1 = "org.bluez.Device1"
+
+
+class _StubBus:
+    """Hashable, weak-referenceable stand-in for a MessageBus."""
+
+
+class _StubProperties:
+    """Device1 Properties proxy whose GetAll blocks until released."""
+
+    def __init__(self, props: dict):
+        self.props = props
+        self.get_all_calls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def call_get_all(self, interface):
+        self.get_all_calls += 1
+        snapshot = dict(self.props)
+        await self.release.wait()
+        return snapshot
+
+    async def call_get(self, interface, name):
+        return self.props[name]
+
+    def on_properties_changed(self, handler):
+        pass
+
+    def off_properties_changed(self, handler):
+        pass
+
+
+@unittest.skipIf(Variant is None, "dbus-next not installed")
+class PropsCacheTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.bus = _StubBus()
+        self.props = _StubProperties({
+            "Paired": Variant("b", True),
+            "Connected": Variant("b", True),
+        })
+        self.device = device_mod.BluezDevice(self.bus, ADDRESS)
+        device_mod._device_proxies[self.bus] = {
+            self.device.path: (object(), self.props),
+        }
+        await self.device.initialize()
+
+    async def test_change_during_get_all_is_kept(self):
+        self.props.release.clear()
+        load = asyncio.ensure_future(self.device.is_connected())
+        await asyncio.sleep(0)  # GetAll now in flight with Connected=True
+        self.device._on_properties_changed(
+            DEVICE1, {"Connected": Variant("b", False)}, []
+        )
+        self.props.release.set()
+        self.assertFalse(await load)
+        self.assertFalse(await self.device.is_connected())
+
+    async def test_removed_device_cache_is_dropped(self):
+        self.assertTrue(await self.device.is_paired())
+        self.props.props["Paired"] = Variant("b", False)
+        device_mod.forget_device_proxies(self.bus, self.device.path)
+        self.assertFalse(await self.device.is_paired())
+
+    async def test_bluetoothd_restart_drops_cache(self):
+        self.assertTrue(await self.device.is_connected())
+        self.props.props["Connected"] = Variant("b", False)
+        device_mod.invalidate_device_caches(self.bus)
+        self.assertFalse(await self.device.is_connected())
+        self.assertEqual(self.props.get_all_calls, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()